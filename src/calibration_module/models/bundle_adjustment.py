@@ -5,6 +5,9 @@ from scipy.optimize import least_squares
 from dataclasses import dataclass
 from typing import List, Tuple, Optional, Dict, Set
 import cv2
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -27,6 +30,7 @@ class BundleAdjustment:
         self.n_cameras = 0
         self.n_views = 0
         self.n_points = 0
+        self.n_residuals = 0
 
     def set_camera_parameters(self, cameras: List[CameraParameters]):
         self.cameras = cameras
@@ -46,11 +50,13 @@ class BundleAdjustment:
         else:
             self.n_points = 0
 
-        # Mark valid views
+        # Mark valid views and size the residual vector once
+        self.n_residuals = 0
         for cam_idx in range(self.n_cameras):
             for view_idx, pts in enumerate(self.image_points[cam_idx]):
                 if pts is not None:
                     self.valid_views[cam_idx].add(view_idx)
+                    self.n_residuals += pts.size
 
     def _params_to_vector(self) -> np.ndarray:
         """Convert camera extrinsic params (rvec, tvec) to a single vector."""
@@ -69,7 +75,10 @@ class BundleAdjustment:
 
     def _compute_residuals(self, x: np.ndarray) -> np.ndarray:
         self._vector_to_params(x)
-        residuals = []
+        # Called for every function and Jacobian evaluation, so fill a
+        # preallocated vector instead of growing a list element by element
+        residuals = np.empty(self.n_residuals, dtype=np.float64)
+        offset = 0
 
         for cam_idx in range(self.n_cameras):
             cam = self.cameras[cam_idx]
@@ -83,11 +92,11 @@ class BundleAdjustment:
 
                 # Compare with actual 2D
                 img_pts_2d = self.image_points[cam_idx][view_idx]
-                if img_pts_2d is not None:
-                    error = (proj_pts_2d - img_pts_2d).ravel()
-                    residuals.extend(error)
+                count = img_pts_2d.size
+                residuals[offset : offset + count] = (proj_pts_2d - img_pts_2d).ravel()
+                offset += count
 
-        return np.array(residuals, dtype=np.float64)
+        return residuals
 
     def optimize(self, verbose: bool = True) -> Dict:
         if self.n_cameras < 1 or self.n_views < 1:
@@ -115,11 +124,14 @@ class BundleAdjustment:
                 verbose=2 if verbose else 0,
             )
             self._vector_to_params(result.x)
-            final_res = self._compute_residuals(result.x)
+            # least_squares already returns the residuals at the solution
+            final_res = result.fun
 
             # Compute stats
             camera_stats = self._compute_camera_statistics(final_res)
-            overall_rms = np.sqrt(np.mean(final_res**2)) if len(final_res) else 0.0
+            total_count = sum(st["n_residuals"] for st in camera_stats.values())
+            total_sum_sq = sum(st["sum_sq"] for st in camera_stats.values())
+            overall_rms = np.sqrt(total_sum_sq / total_count) if total_count else 0.0
 
             stereo_rms_mm = None
             if len(self.cameras) >= 2:
@@ -138,7 +150,7 @@ class BundleAdjustment:
                 "message": result.message,
             }
         except Exception as e:
-            print(f"Bundle adjustment failed: {e}")
+            logger.exception("Bundle adjustment failed")
             return {
                 "success": False,
                 "error": str(e),
@@ -149,31 +161,42 @@ class BundleAdjustment:
     def _compute_camera_statistics(self, final_residuals: np.ndarray) -> Dict:
         """
         We break down residuals camera by camera. Each valid view has 2D * N_points errors.
+        Per camera we keep running sums (count, sum, sum of squares), so RMS, mean
+        and standard deviation, and the overall RMS, are derived from them.
         """
         stats = {}
         idx = 0
         for cam_idx in range(self.n_cameras):
-            cam_residuals = []
             n_valid_views = len(self.valid_views[cam_idx])
 
             # For each valid view, we have self.n_points * 2 residual values
             # So total residual count for this camera = n_valid_views * (n_points*2)
             count_for_cam = n_valid_views * (self.n_points * 2)
-            if count_for_cam > 0:
-                cam_residuals = final_residuals[idx : idx + count_for_cam]
-                idx += count_for_cam
-
-            if len(cam_residuals):
-                rms = np.sqrt(np.mean(cam_residuals**2))
+            cam_residuals = final_residuals[idx : idx + count_for_cam]
+            idx += count_for_cam
+
+            count = len(cam_residuals)
+            if count:
+                res_sum = float(cam_residuals.sum())
+                res_sum_sq = float(np.dot(cam_residuals, cam_residuals))
+                mean = res_sum / count
+                rms = np.sqrt(res_sum_sq / count)
+                std = np.sqrt(max(res_sum_sq / count - mean**2, 0.0))
                 max_err = np.max(np.abs(cam_residuals))
             else:
+                res_sum = res_sum_sq = 0.0
                 rms = float("inf")
+                std = float("inf")
                 max_err = float("inf")
 
             stats[cam_idx] = {
                 "rms": rms,
+                "std": std,
                 "n_valid_views": n_valid_views,
                 "max_error": max_err,
+                "n_residuals": count,
+                "sum": res_sum,
+                "sum_sq": res_sum_sq,
             }
 
         return stats
@@ -255,19 +278,19 @@ class BundleAdjustment:
 
                         # Compute errors
                         diffs = triangulated_3d - aligned
-                        errors = np.linalg.norm(diffs, axis=1)
-                        all_3d_errors.extend(errors.tolist())
+                        all_3d_errors.append(np.linalg.norm(diffs, axis=1))
 
-                except Exception as e:
-                    print(f"Error in 3D alignment for view {view_idx}: {str(e)}")
+                except Exception:
+                    logger.exception("Error in 3D alignment for view %d", view_idx)
                     continue
 
             # Compute final RMS
             if len(all_3d_errors) > 0:
-                rms_3d = float(np.sqrt(np.mean(np.square(all_3d_errors))))
+                errors_3d = np.concatenate(all_3d_errors)
+                rms_3d = float(np.sqrt(np.mean(np.square(errors_3d))))
                 return rms_3d
             return None
 
-        except Exception as e:
-            print(f"Bundle adjustment 3D error computation failed: {str(e)}")
+        except Exception:
+            logger.exception("Bundle adjustment 3D error computation failed")
             return None
@@ -1,9 +1,26 @@
 import cv2
 import numpy as np
+from functools import lru_cache
 from typing import Tuple, Optional
 from core.constants.settings_constants import CalibrationTarget
 from core.error_handling.exceptions import CalibrationError
 from services.service_locator import ServiceLocator
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=8)
+def checkerboard_object_points(rows: int, cols: int, square_size: float) -> np.ndarray:
+    """
+    3D corner positions of a rows x cols checkerboard on the Z=0 plane, in
+    findChessboardCorners order. Cached and read-only, since every view of
+    the same board shares it.
+    """
+    object_points = np.zeros((rows * cols, 3), np.float32)
+    object_points[:, :2] = np.mgrid[0:rows, 0:cols].T.reshape(-1, 2) * square_size
+    object_points.setflags(write=False)
+    return object_points
 
 
 class CalibrationDetector:
@@ -15,6 +32,16 @@ class CalibrationDetector:
         self.settings_service = ServiceLocator.get_instance().get_service(
             "settings_service"
         )
+        # Run the per-pixel stages through OpenCV's T-API (UMat) when an OpenCL
+        # device is available; results are downloaded only at the end
+        self._use_opencl = cv2.ocl.haveOpenCL()
+        if self._use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+
+    def _to_gray(self, image: np.ndarray):
+        """Convert to grayscale, as a UMat on the OpenCL device if enabled."""
+        src = cv2.UMat(image) if self._use_opencl else image
+        return cv2.cvtColor(src, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else src
 
     # In calibration_detector.py - Update the detect method
     def detect(self, image: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
@@ -37,33 +64,28 @@ class CalibrationDetector:
     def _detect_checkerboard(self, image: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """Detect checkerboard pattern"""
         try:
-            gray = (
-                cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-                if len(image.shape) == 3
-                else image
-            )
+            gray = self._to_gray(image)
 
             # Get pattern parameters from settings
-            pattern_rows = int(
-                self.settings_service.get_setting("calibration.pattern_rows")
-            )
-            pattern_cols = int(
-                self.settings_service.get_setting("calibration.pattern_cols")
-            )
+            calibration_settings = self.settings_service.get_settings("calibration")
+            pattern_rows = int(calibration_settings.get("pattern_rows"))
+            pattern_cols = int(calibration_settings.get("pattern_cols"))
             pattern_size = (pattern_rows, pattern_cols)
-            square_size = float(
-                self.settings_service.get_setting("calibration.square_size")
-            )
+            square_size = float(calibration_settings.get("square_size"))
 
-            print(f"Looking for pattern: {pattern_size}, square size: {square_size}mm")
-            print(f"Image shape: {gray.shape}")
+            logger.debug(
+                "Looking for pattern %s, square size %smm, image shape %s",
+                pattern_size,
+                square_size,
+                image.shape[:2],
+            )
 
             # Add flags for better detection
             flags = cv2.CALIB_CB_ADAPTIVE_THRESH + cv2.CALIB_CB_NORMALIZE_IMAGE
             ret, corners = cv2.findChessboardCorners(gray, pattern_size, flags)
 
             if not ret:
-                print("Failed to find checkerboard pattern")
+                logger.debug("Failed to find checkerboard pattern")
                 # Save debug image if needed
                 # cv2.imwrite(f"debug_pattern_{time.time()}.jpg", gray)
                 raise ValueError(
@@ -73,33 +95,31 @@ class CalibrationDetector:
             # Refine corners
             criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 30, 0.001)
             corners = cv2.cornerSubPix(gray, corners, (11, 11), (-1, -1), criteria)
+            if isinstance(corners, cv2.UMat):
+                corners = corners.get()
 
-            print(f"Found {len(corners)} corners")
+            logger.debug("Found %d corners", len(corners))
 
-            # Generate 3D object points
-            object_points = np.zeros((pattern_size[0] * pattern_size[1], 3), np.float32)
-            object_points[:, :2] = np.mgrid[
-                0 : pattern_size[0], 0 : pattern_size[1]
-            ].T.reshape(-1, 2)
-            object_points *= square_size
+            return corners, checkerboard_object_points(*pattern_size, square_size)
 
-            return corners, object_points
-
-        except Exception as e:
-            print(f"Checkerboard detection error: {str(e)}")
+        except Exception:
+            logger.exception("Checkerboard detection error")
             raise
 
     def _detect_cube(self, image: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """Detect calibration cube corners"""
-        gray = (
-            cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
-        )
+        gray = self._to_gray(image)
 
         # Apply adaptive thresholding
         thresh = cv2.adaptiveThreshold(
             gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
         )
 
+        # Contour analysis runs on the CPU
+        if isinstance(gray, cv2.UMat):
+            gray = gray.get()
+            thresh = thresh.get()
+
         # Find contours
         contours, _ = cv2.findContours(thresh, cv2.RETR_LIST, cv2.CHAIN_APPROX_SIMPLE)
 
@@ -4,6 +4,7 @@ from calibration_module.models.bundle_adjustment import (
     BundleAdjustment,
     CameraParameters,
 )
+from calibration_module.models.calibration_detector import checkerboard_object_points
 from typing import List, Tuple, Optional
 from PySide6.QtCore import QObject, Signal
 from services.service_locator import ServiceLocator
@@ -80,14 +81,13 @@ class CalibrationModel(QObject):
         # Ensure object_points list is long enough to store this view
         if len(self.object_points) <= view_idx:
             # Construct object points based on the pattern size
-            rows = int(self.settings_service.get_setting("calibration.pattern_rows"))
-            cols = int(self.settings_service.get_setting("calibration.pattern_cols"))
-            square_size = float(
-                self.settings_service.get_setting("calibration.square_size")
+            calibration_settings = self.settings_service.get_settings("calibration")
+            rows = int(calibration_settings.get("pattern_rows"))
+            cols = int(calibration_settings.get("pattern_cols"))
+            square_size = float(calibration_settings.get("square_size"))
+            self.object_points.append(
+                checkerboard_object_points(rows, cols, square_size)
             )
-            objp = np.zeros((rows * cols, 3), np.float32)
-            objp[:, :2] = np.mgrid[0:rows, 0:cols].T.reshape(-1, 2) * square_size
-            self.object_points.append(objp)
 
         valid_detections = 0
         for cam_idx, (frame, points_2d) in enumerate(frame_data):
@@ -119,6 +119,7 @@ class CalibrationModel(QObject):
         self.dist_coeffs = []
         self.rotations = []
         self.translations = []
+        flags = self._solver_flags()
 
         for cam_idx in range(self.n_cameras):
             valid_views = list(self.valid_views[cam_idx])
@@ -140,7 +141,7 @@ class CalibrationModel(QObject):
                 pass  # If you want to do more logic, do it here
 
             ret, mtx, dist, rvecs, tvecs = cv2.calibrateCamera(
-                obj_points_list, img_points_list, img_size, None, None
+                obj_points_list, img_points_list, img_size, None, None, flags=flags
             )
             if not ret:
                 raise CalibrationError(
@@ -154,24 +155,47 @@ class CalibrationModel(QObject):
             self.rotations.append(rvecs[-1])
             self.translations.append(tvecs[-1])
 
-    def perform_global_calibration(self):
+    def _solver_flags(self) -> int:
+        """
+        Flags for cv2.calibrateCamera. By default the LM step is solved with LU
+        instead of SVD and k3 is fixed, which is much faster for many views.
+        Set calibration.solver_use_lu to false to get OpenCV's default solver.
+        """
+        use_lu = self.settings_service.get_setting("calibration.solver_use_lu")
+        if str(use_lu).lower() in ("false", "0"):
+            return 0
+        return cv2.CALIB_USE_LU | cv2.CALIB_FIX_K3
+
+    def perform_global_calibration(
+        self, initial_params: Optional[List[CameraParameters]] = None
+    ):
         """
         Perform single-camera calibration first, then run bundle adjustment for multi-camera.
+        Args:
+            initial_params: Optimized cameras from an earlier solve of this
+                session's views. When given for the same number of cameras,
+                their extrinsics seed the bundle adjustment instead of the
+                single-camera estimates.
         Returns: dict with results
         """
         try:
             # Single-camera calibration
             self.calibrate_single_cameras()
 
+            # Warm-start from the previous solve if it matches this rig
+            if initial_params is not None and len(initial_params) != self.n_cameras:
+                initial_params = None
+
             # Now run global optimization
             ba = BundleAdjustment()
             cameras = []
             for i in range(self.n_cameras):
+                seed = initial_params[i] if initial_params is not None else None
                 cam = CameraParameters(
                     camera_matrix=self.camera_matrices[i],
                     dist_coeffs=self.dist_coeffs[i],
-                    rvec=self.rotations[i],
-                    tvec=self.translations[i],
+                    rvec=seed.rvec if seed is not None else self.rotations[i],
+                    tvec=seed.tvec if seed is not None else self.translations[i],
                 )
                 cameras.append(cam)
 
@@ -189,6 +213,8 @@ class CalibrationModel(QObject):
                     "success": False,
                     "message": "Global optimization failed",
                     "overall_rms": float("inf"),
+                    # Still a better seed for the next solve than a cold start
+                    "optimized_cameras": results.get("optimized_cameras"),
                 }
 
         except Exception as e:
@@ -202,6 +228,7 @@ class CalibrationModel(QObject):
             "overall_rms_mm": results.get("overall_rms_mm"),
             "per_camera": {},
             "baseline": {},
+            "optimized_cameras": results["optimized_cameras"],
         }
 
         # Copy over camera_stats
@@ -212,18 +239,17 @@ class CalibrationModel(QObject):
                 "max_error": stats["max_error"],
             }
 
-        # Compute pairwise baselines
+        # Compute pairwise baselines. |t2 - R2 R1^T t1| is the distance between
+        # the camera centres C = -R^T t, so all pairs come from one norm call.
         optimized_cameras = results["optimized_cameras"]
-        for i in range(len(optimized_cameras) - 1):
-            for j in range(i + 1, len(optimized_cameras)):
-                R1, _ = cv2.Rodrigues(optimized_cameras[i].rvec)
-                R2, _ = cv2.Rodrigues(optimized_cameras[j].rvec)
-                t1 = optimized_cameras[i].tvec
-                t2 = optimized_cameras[j].tvec
-
-                R_rel = R2 @ R1.T
-                t_rel = t2 - R_rel @ t1
-                baseline = np.linalg.norm(t_rel)
-                summary["baseline"][f"{i}-{j}"] = baseline
+        n_cams = len(optimized_cameras)
+        if n_cams >= 2:
+            R = np.stack([cv2.Rodrigues(cam.rvec)[0] for cam in optimized_cameras])
+            T = np.stack([cam.tvec.reshape(3) for cam in optimized_cameras])
+            centers = -np.einsum("nji,nj->ni", R, T)
+            i_idx, j_idx = np.triu_indices(n_cams, k=1)
+            baselines = np.linalg.norm(centers[i_idx] - centers[j_idx], axis=1)
+            for i, j, baseline in zip(i_idx, j_idx, baselines):
+                summary["baseline"][f"{i}-{j}"] = float(baseline)
 
         return summary
@@ -1,7 +1,8 @@
 # src/models/calibration_model.py
 import cv2
 import numpy as np
-from PySide6.QtCore import QObject, Signal
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from PySide6.QtCore import QObject, QTimer, Signal
 
 class WizardModel(QObject):
     calibration_status = Signal(str)
@@ -21,6 +22,13 @@ class WizardModel(QObject):
         self.rotations = []         # Rotation matrices
         self.translations = []      # Translation vectors
 
+        # Progress updates are coalesced and emitted at most every ~33 ms
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
     def _create_cube_points(self):
         """
         Create 3D points for cube corners in cube coordinate system.
@@ -46,25 +54,26 @@ class WizardModel(QObject):
         """
         try:
             self.calibration_status.emit("Starting cube detection...")
-            self.calibration_progress.emit(10)
+            self._queue_progress(10)
             
             # Initialize storage for detected corners
-            image_points = []  # 2D points in image plane for each camera
+            image_points = [None] * len(frames)  # 2D points in image plane for each camera
             
-            # Detect cube corners in each frame
-            for i, frame in enumerate(frames):
-                self.calibration_status.emit(f"Processing camera {i+1}...")
-                
-                # Convert to grayscale for corner detection
-                gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
-                
-                # Detect cube corners
-                corners = self._detect_cube_corners(gray)
-                if corners is None:
-                    raise Exception(f"Failed to detect cube in camera {i+1}")
+            # Detect cube corners in all frames concurrently (OpenCV releases the GIL)
+            self.calibration_status.emit(f"Processing {len(frames)} cameras...")
+            with ThreadPoolExecutor(max_workers=max(1, len(frames))) as executor:
+                futures = {
+                    executor.submit(self._detect_frame_corners, frame): i
+                    for i, frame in enumerate(frames)
+                }
+                for n_done, future in enumerate(as_completed(futures), start=1):
+                    i = futures[future]
+                    corners = future.result()
+                    if corners is None:
+                        raise Exception(f"Failed to detect cube in camera {i+1}")
                     
-                image_points.append(corners)
-                self.calibration_progress.emit(30 + i*20)
+                    image_points[i] = corners
+                    self._queue_progress(10 + n_done*20)
             
             # Calibrate each camera individually
             for i, (frame, corners) in enumerate(zip(frames, image_points)):
@@ -91,19 +100,42 @@ class WizardModel(QObject):
                 self.rotations.append(rvecs[0])
                 self.translations.append(tvecs[0])
                 
-                self.calibration_progress.emit(70 + i*10)
+                self._queue_progress(70 + i*10)
             
             # Save calibration results
             self._save_calibration_results()
             
             self.calibration_status.emit("Calibration completed successfully")
-            self.calibration_progress.emit(100)
+            self._queue_progress(100)
+            self._flush_progress()
             self.calibration_complete.emit(True, "Calibration successful")
             
         except Exception as e:
             self.calibration_status.emit(f"Calibration failed: {str(e)}")
+            self._flush_progress()
             self.calibration_complete.emit(False, str(e))
 
+    def _queue_progress(self, value):
+        """Record the latest progress value and arm the flush timer if idle."""
+        self._pending_progress = value
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self):
+        """Emit the most recent pending progress value, if any."""
+        self._progress_timer.stop()
+        if self._pending_progress is not None:
+            value, self._pending_progress = self._pending_progress, None
+            self.calibration_progress.emit(value)
+
+    def _detect_frame_corners(self, frame):
+        """
+        Convert a camera frame to grayscale and detect cube corners in it.
+        Runs on a worker thread, so it must not emit signals.
+        """
+        gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+        return self._detect_cube_corners(gray)
+
     def _detect_cube_corners(self, gray_image):
         """
         Detect cube corners in grayscale image.
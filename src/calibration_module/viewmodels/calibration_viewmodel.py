@@ -1,7 +1,10 @@
-from PySide6.QtCore import QObject, Signal
-from typing import List, Dict
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Optional
 import numpy as np
 import cv2
+import logging
+import os
 
 from core.error_handling.exceptions import (
     CalibrationError,
@@ -12,13 +15,40 @@ from services.service_locator import ServiceLocator
 from core.constants.settings_constants import CalibrationTarget
 from calibration_module.models.calibration_detector import CalibrationDetector
 
+logger = logging.getLogger(__name__)
+
+
+class CalibrationWorkerSignals(QObject):
+    """Signals emitted by CalibrationWorker (QRunnable cannot define signals)."""
+
+    finished = Signal(object)  # results dict from perform_global_calibration
+
+
+class CalibrationWorker(QRunnable):
+    """Runs the global calibration of a CalibrationModel off the GUI thread."""
+
+    def __init__(self, calibration_model, initial_params=None):
+        super().__init__()
+        self.calibration_model = calibration_model
+        self.initial_params = initial_params
+        self.signals = CalibrationWorkerSignals()
+
+    def run(self):
+        try:
+            results = self.calibration_model.perform_global_calibration(
+                initial_params=self.initial_params
+            )
+        except Exception as e:
+            results = {"success": False, "error": str(e)}
+        self.signals.finished.emit(results)
+
 
 class CalibrationViewModel(QObject):
     # Signals used by the view
     status_changed = Signal(str)
     progress_updated = Signal(int)
     calibration_finished = Signal(bool, str, dict)  # success, message, results
-    overlay_updated = Signal(list, dict)  # points, quality metrics per camera
+    overlay_updated = Signal(list, dict)  # 2D points, quality metrics per camera
     preview_state_changed = Signal(bool)  # True when preview is active
     quality_updated = Signal(dict)  # Quality metrics for current detection
 
@@ -33,6 +63,17 @@ class CalibrationViewModel(QObject):
     button_reset_changed = Signal(bool)  # Controls redetect button State
     progress_visible_changed = Signal(bool)  # Controls progress bar visibility
 
+    # Guidance shown for each captured view; the last entry repeats past the end
+    _GUIDANCE = (
+        "Place pattern front-and-center, slightly tilted",
+        "Move pattern left or tilt left ~30°",
+        "Move pattern right or tilt right ~30°",
+        "Tilt forward/backward ~45°",
+        "Rotate pattern around its axis ~45°",
+        "Move pattern closer or further from cameras",
+        "Try an arbitrary orientation for coverage",
+    )
+
     def __init__(self):
         super().__init__()
         self.locator = ServiceLocator.get_instance()
@@ -49,17 +90,45 @@ class CalibrationViewModel(QObject):
         self.current_view = 0
         self.calibration_successful = False
 
-        # Runtime data
-        self._detector = None
-
-        self._initialize_detector()
+        # Pre-formatted guidance text, one entry per view
+        last_idx = len(self._GUIDANCE) - 1
+        self._guidance_cache = [
+            f"View {i + 1}/{self.required_views}: {self._GUIDANCE[min(i, last_idx)]}"
+            for i in range(self.required_views)
+        ]
 
-    def _initialize_detector(self):
-        """Initialize pattern detector based on settings."""
+        # Runtime data; the detector is built on first use
+        self._detector = None
+        # Optimized cameras from a failed solve of this session; the re-solve
+        # after the user captures more views is warm-started from them
+        self._last_cam_params = None
+        # Shared thread pool for per-camera detection, created on first use
+        self._detect_pool = None
+        self._detect_pool_size = 0
+        # Worker running the global calibration, if any
+        self._calibration_worker = None
+        # Quality gate specialized on the current thresholds, rebuilt on change
+        self._detection_validator = None
+
+        self.settings_service.setting_changed.connect(self._on_setting_changed)
+
+    def _on_setting_changed(self, key: str, value: str):
+        """Drop cached settings when the corresponding setting is edited."""
+        setting = key.split(".")[-1]
+        if setting in ("min_quality_score", "min_coverage"):
+            self._detection_validator = None
+        elif setting == "target_type":
+            self._detector = None
+            self._last_cam_params = None
+        elif setting in ("pattern_rows", "pattern_cols", "square_size"):
+            self._last_cam_params = None
+
+    def _initialize_detector(self, target_type: str):
+        """Initialize pattern detector for the given target type."""
         try:
-            target_type = self.settings_service.get_setting("calibration.target_type")
             self._detector = CalibrationDetector(target_type)
         except Exception as e:
+            self._detector = None
             self.error_manager.report_error(
                 SystemError(
                     ErrorSeverity.ERROR,
@@ -87,9 +156,12 @@ class CalibrationViewModel(QObject):
         """
         Reset everything to start capturing multiple views.
         """
+        if self._global_calibration_running():
+            return
         self.is_calibrating = True
         self.calibration_successful = False
         self.current_view = 0
+        self._last_cam_params = None
 
         # Reset model data
         self.calibration_model.reset()
@@ -111,38 +183,47 @@ class CalibrationViewModel(QObject):
         if not self.is_calibrating:
             self.status_changed.emit("Not in calibration mode.")
             return False
+        if self._global_calibration_running():
+            return False
         if not frames:
             self.status_changed.emit("No frames provided.")
             return False
+        if not self._validate_frames(frames):
+            self.status_changed.emit("Received an empty frame from a camera.")
+            return False
+
+        # Build the detector lazily; a target type change drops it
+        if self._detector is None:
+            self._initialize_detector(
+                self.settings_service.get_setting("calibration.target_type")
+            )
+            if self._detector is None:
+                self.status_changed.emit("Pattern detector unavailable.")
+                return False
+
+        is_valid = self._get_detection_validator()
+        if is_valid is None:
+            return False
 
         try:
-            # Detect pattern in each camera
-            detections = []
-            quality_metrics = {}
-            for i, frame in enumerate(frames):
-                try:
-                    points_2d, points_3d = self._detector.detect(frame)
-                    detections.append((points_2d, points_3d))
-                    quality_metrics[i] = self._calculate_detection_quality(points_2d)
-                    self.camera_status_updated.emit(
-                        i, f"Pattern detected: {len(points_2d)} points"
-                    )
-                except Exception as e:
-                    self.camera_status_updated.emit(i, f"Detection failed: {str(e)}")
-                    return False
+            detected = self._detect_frames(frames, is_valid)
+            if detected is None:
+                return False
+            points_per_camera, quality_metrics, valid_cameras = detected
 
-            # Send overlay for debugging
-            self.overlay_updated.emit(detections, quality_metrics)
+            # Send overlay for debugging: the 2D points of each detected camera
+            self.overlay_updated.emit(points_per_camera, quality_metrics)
 
-            # Validate quality across cameras
-            if not self._validate_detection_quality(quality_metrics):
+            # For multi-camera systems, you might require at least 2 cameras pass
+            # or that ALL cameras pass. For now, let's say at least 2 must pass:
+            if valid_cameras < 2:
                 self.status_changed.emit("Detection quality insufficient")
                 return False
 
             # Store data in the Model at the index = current_view
             success = self.calibration_model.process_view(
                 view_idx=self.current_view,
-                frame_data=[(frame, det[0]) for frame, det in zip(frames, detections)],
+                frame_data=list(zip(frames, points_per_camera)),
             )
             if not success:
                 self.status_changed.emit("Failed to process view in model")
@@ -153,7 +234,7 @@ class CalibrationViewModel(QObject):
             self.view_captured.emit(self.current_view, self.required_views)
 
             # Update progress bar
-            progress_val = int((self.current_view / self.required_views) * 100)
+            progress_val = min(100, self.current_view * 100 // self.required_views)
             self.progress_updated.emit(progress_val)
 
             if self.current_view >= self.required_views:
@@ -170,10 +251,103 @@ class CalibrationViewModel(QObject):
             self._handle_error("Frame processing failed", e)
             return False
 
+    def _validate_frames(self, frames: List[np.ndarray]) -> bool:
+        """Check that every camera delivered a non-empty frame."""
+        return all(frame is not None and frame.size for frame in frames)
+
+    def _get_detect_pool(self, n_cameras: int) -> ThreadPoolExecutor:
+        """Return the shared per-camera detection pool, sized for n_cameras."""
+        n_workers = min(n_cameras, os.cpu_count() or 1)
+        if self._detect_pool is None or self._detect_pool_size != n_workers:
+            if self._detect_pool is not None:
+                self._detect_pool.shutdown(wait=False)
+            self._detect_pool = ThreadPoolExecutor(
+                max_workers=n_workers, thread_name_prefix="calib-detect"
+            )
+            self._detect_pool_size = n_workers
+        return self._detect_pool
+
+    def _detect_frames(
+        self, frames: List[np.ndarray], is_valid: Callable[[Dict], bool]
+    ):
+        """
+        Run pattern detection for all cameras concurrently.
+        Results are consumed in camera order so that detection stops as soon as
+        it is no longer possible for two cameras to pass the quality gate.
+        Returns:
+            (points_per_camera, quality_metrics, valid_cameras), or None if a camera
+            failed to detect the pattern.
+        """
+        n_cameras = len(frames)
+        pool = self._get_detect_pool(n_cameras)
+
+        # OpenCV parallelizes internally as well; split the cores between the
+        # cameras instead of letting every detection oversubscribe them.
+        prev_cv_threads = cv2.getNumThreads()
+        cv2.setNumThreads(max(1, (os.cpu_count() or 1) // n_cameras))
+
+        futures = []
+        try:
+            futures = [pool.submit(self._detector.detect, frame) for frame in frames]
+
+            # 2D points by camera index; stays None for cameras skipped on early exit
+            points_per_camera = [None] * n_cameras
+            quality_metrics = {}
+            valid_cameras = 0
+            for i, future in enumerate(futures):
+                try:
+                    points_2d, _ = future.result()
+                    points_2d = np.ascontiguousarray(points_2d, dtype=np.float32)
+                    points_per_camera[i] = points_2d
+                    quality_metrics[i] = self._calculate_detection_quality(points_2d)
+                    self.camera_status_updated.emit(
+                        i, f"Pattern detected: {len(points_2d)} points"
+                    )
+                except Exception as e:
+                    self.camera_status_updated.emit(i, f"Detection failed: {str(e)}")
+                    return None
+
+                if is_valid(quality_metrics[i]):
+                    valid_cameras += 1
+                remaining = n_cameras - i - 1
+                if valid_cameras + remaining < 2:
+                    break
+
+            return points_per_camera, quality_metrics, valid_cameras
+
+        finally:
+            # Drop detections that have not started yet once we stop early
+            for future in futures:
+                future.cancel()
+            cv2.setNumThreads(prev_cv_threads)
+
     def _complete_calibration(self):
-        """Perform final steps: single camera calibrations + global bundle adjustment."""
+        """
+        Perform final steps: single camera calibrations + global bundle adjustment.
+        The solve runs on the global QThreadPool so the UI stays responsive;
+        _on_global_calibration_finished picks up the results on the GUI thread.
+        """
         self.status_changed.emit("Performing global calibration...")
-        results = self.calibration_model.perform_global_calibration()
+        worker = CalibrationWorker(self.calibration_model, self._last_cam_params)
+        worker.signals.finished.connect(
+            self._on_global_calibration_finished, Qt.ConnectionType.QueuedConnection
+        )
+        self._calibration_worker = worker
+        # The worker reads the model's view data; no captures or resets until it is done
+        self.button_enabled_changed.emit(False)
+        self.button_reset_changed.emit(False)
+        QThreadPool.globalInstance().start(worker)
+
+    def _global_calibration_running(self) -> bool:
+        """True, with a status message, while the global calibration worker runs."""
+        if self._calibration_worker is None:
+            return False
+        self.status_changed.emit("Global calibration in progress, please wait")
+        return True
+
+    def _on_global_calibration_finished(self, results: dict):
+        """Handle the global calibration results delivered by CalibrationWorker."""
+        self._calibration_worker = None
         success = results.get("success", False)
 
         if success:
@@ -185,22 +359,32 @@ class CalibrationViewModel(QObject):
                     rotations=self.calibration_model.rotations,
                     translations=self.calibration_model.translations,
                 )
-                print("Calibration results stored successfully")
-            except Exception as e:
-                print(f"Failed to store calibration: {str(e)}")
+                logger.debug("Calibration results stored")
+            except Exception:
+                logger.exception("Failed to store calibration")
             # Continue with emit since calibration itself was successful
             self.calibration_successful = True
             self.calibration_finished.emit(
                 True, "Calibration completed successfully", results
             )
             self.status_changed.emit("Calibration successful!")
+            self.is_calibrating = False
+            self._last_cam_params = None
         else:
+            # Keep the session open: another view triggers a re-solve, seeded
+            # from this attempt's cameras when the optimizer produced any
+            if results.get("optimized_cameras"):
+                self._last_cam_params = results["optimized_cameras"]
             self.calibration_finished.emit(
                 False, "Calibration failed accuracy requirements", results
             )
-            self.status_changed.emit("Calibration failed - please retry")
+            self.button_text_changed.emit(f"Capture View {self.current_view + 1}")
+            self.status_changed.emit(
+                "Calibration failed - capture another view to retry"
+            )
 
-        self.is_calibrating = False
+        self.button_enabled_changed.emit(True)
+        self.button_reset_changed.emit(True)
 
     def _calculate_detection_quality(self, points_2d: np.ndarray) -> dict:
         """Calculate some simple quality metrics for the detected points."""
@@ -218,10 +402,13 @@ class CalibrationViewModel(QObject):
             coverage = pattern_area / frame_area if frame_area > 0 else 0
 
             # distribution
-            center = np.mean(points_2d, axis=0)
-            distances = np.linalg.norm(points_2d - center, axis=1)
+            center = np.mean(points_2d, axis=0, dtype=np.float32)
+            distances = np.linalg.norm(
+                np.subtract(points_2d, center, dtype=np.float32), axis=1
+            )
+            mean_distance = np.mean(distances)
             distribution = (
-                np.std(distances) / np.mean(distances) if np.mean(distances) > 0 else 1
+                np.std(distances) / mean_distance if mean_distance > 0 else 1
             )
 
             # simple score
@@ -236,8 +423,17 @@ class CalibrationViewModel(QObject):
             self._handle_error("Quality calculation failed", e)
             return {"score": 0, "coverage": 0, "stability": 0}
 
-    def _validate_detection_quality(self, quality_metrics: Dict) -> bool:
-        """Validate if detection quality is sufficient."""
+    def _get_detection_validator(self) -> Optional[Callable[[Dict], bool]]:
+        """Return the per-camera quality gate, building it on first use."""
+        if self._detection_validator is None:
+            self._detection_validator = self._build_detection_validator()
+        return self._detection_validator
+
+    def _build_detection_validator(self) -> Optional[Callable[[Dict], bool]]:
+        """
+        Read the quality thresholds once and bind them into a closure, so
+        checking a camera is two comparisons with no settings lookups.
+        """
         try:
             min_quality_score = float(
                 self.settings_service.get_setting("calibration.min_quality_score")
@@ -245,50 +441,30 @@ class CalibrationViewModel(QObject):
             min_coverage = float(
                 self.settings_service.get_setting("calibration.min_coverage")
             )
-
-            valid_cameras = 0
-            for cam_idx, metrics in quality_metrics.items():
-                score_ok = metrics["score"] >= min_quality_score
-                coverage_ok = metrics["coverage"] >= min_coverage
-                if score_ok and coverage_ok:
-                    valid_cameras += 1
-
-            # For multi-camera systems, you might require at least 2 cameras pass
-            # or that ALL cameras pass. For now, let's say at least 2 must pass:
-            return valid_cameras >= 2
-
         except Exception as e:
             self._handle_error("Quality validation failed", e)
-            return False
+            return None
+
+        def is_valid(metrics: Dict) -> bool:
+            return (
+                metrics["score"] >= min_quality_score
+                and metrics["coverage"] >= min_coverage
+            )
+
+        return is_valid
 
     def _update_guidance(self):
         """Provide guidance text based on the current view index."""
         if not self.is_calibrating:
             return
 
-        total = self.required_views
-        current = self.current_view
-        if current >= total:
+        if self.current_view >= self.required_views:
             self.guidance_updated.emit(
                 "All views captured. Running final calibration..."
             )
             return
 
-        # Some example guidance
-        messages = [
-            "Place pattern front-and-center, slightly tilted",
-            "Move pattern left or tilt left ~30°",
-            "Move pattern right or tilt right ~30°",
-            "Tilt forward/backward ~45°",
-            "Rotate pattern around its axis ~45°",
-            "Move pattern closer or further from cameras",
-            "Try an arbitrary orientation for coverage",
-        ]
-
-        # Limit the index for messages
-        msg_idx = min(current, len(messages) - 1)
-        guidance = f"View {current + 1}/{total}: {messages[msg_idx]}"
-        self.guidance_updated.emit(guidance)
+        self.guidance_updated.emit(self._guidance_cache[self.current_view])
 
     def _clear_overlay(self):
         """Clear detection overlays."""
@@ -305,10 +481,13 @@ class CalibrationViewModel(QObject):
 
     def reset_calibration(self):
         """Reset calibration state and clear all data."""
-        print("Resetting calibration state")
+        if self._global_calibration_running():
+            return
+        logger.debug("Resetting calibration state")
         self.is_calibrating = False
         self.calibration_successful = False
         self.current_view = 0
+        self._last_cam_params = None
         self.calibration_model.reset()
         self.status_changed.emit("Calibration reset")
         self._clear_overlay()
@@ -1,5 +1,8 @@
 from PySide6.QtCore import QObject, Signal
 from services.service_locator import ServiceLocator
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class WizardViewModel(QObject):
@@ -23,8 +26,18 @@ class WizardViewModel(QObject):
             # Load general wizard settings
             # NOT camera-specific settings
             pass
-        except Exception as e:
-            print(f"Error loading wizard configuration: {str(e)}")
+        except Exception:
+            logger.exception("Error loading wizard configuration")
+
+    def handle_wizard_finished(self, result: int):
+        """Handle the wizard closing; result is the QDialog result code"""
+        completed = result == 1  # QDialog.Accepted
+        message = (
+            "Calibration wizard completed"
+            if completed
+            else "Calibration wizard cancelled"
+        )
+        self.wizard_completed.emit(completed, message)
 
     def handle_step_completion(
         self, step_number: int, success: bool, results: dict = None
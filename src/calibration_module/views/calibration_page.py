@@ -9,15 +9,47 @@ from PySide6.QtWidgets import (
     QProgressBar,
     QGroupBox,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
+from itertools import chain, repeat
+import logging
 import numpy as np
 
 from services.service_locator import ServiceLocator
 from camera_module.views.camera_view import CameraView
 from core.constants.settings_constants import CalibrationTarget, CameraSetup
 
+logger = logging.getLogger(__name__)
+
+_INSTRUCTIONS_HEADER = "1. Click 'Preview All Cameras' to start camera feeds\n\n"
+_CUBE_INSTRUCTIONS = _INSTRUCTIONS_HEADER + (
+    "2. Place the calibration cube in the working volume\n"
+    "3. Ensure the cube is visible in all cameras\n"
+    "4. Check that cube corners are well-lit and visible\n"
+    "5. Click 'Start Calibration' when ready (and follow instructions)"
+)
+_CHECKERBOARD_INSTRUCTIONS = _INSTRUCTIONS_HEADER + (
+    "2. Hold the checkerboard in the working volume\n"
+    "3. Ensure the pattern is fully visible\n"
+    "4. Avoid reflections and ensure good lighting\n"
+    "5. Click 'Start Calibration' when ready (and follow instructions)"
+)
+# Instruction text per target type; unknown types get the checkerboard text
+_INSTRUCTIONS = {
+    CalibrationTarget.CUBE.value: _CUBE_INSTRUCTIONS,
+    CalibrationTarget.CHECKERBOARD.value: _CHECKERBOARD_INSTRUCTIONS,
+}
+
 
 class CalibrationPage(QWizardPage):
+    # Applied once to the camera group rather than parsed per camera view
+    _CAMERA_QSS = """
+        CameraView QLabel {
+            background-color: black;
+            border: 1px solid #666;
+            color: white;
+        }
+        """
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setTitle("System Calibration")
@@ -27,6 +59,7 @@ class CalibrationPage(QWizardPage):
         self.locator = ServiceLocator.get_instance()
         self.settings_service = self.locator.get_service("settings_service")
         self.calibration_viewmodel = self.locator.get_service("calibration_viewmodel")
+        self.camera_server = self.locator.get_service("camera_server")
 
         # Connect signals from ViewModel
         self._connect_viewmodel_signals()
@@ -34,7 +67,21 @@ class CalibrationPage(QWizardPage):
         # Initialize settings-dependent attributes
         self.camera_setup = self.settings_service.get_setting("cameras.camera_setup")
         self.target_type = self.settings_service.get_setting("calibration.target_type")
+        # Resolve the camera count and viewmodels once, before building the UI
+        self.num_cameras = CameraSetup.get_num_cameras(self.camera_setup)
+        self.camera_viewmodels = self.locator.get_services("camera_viewmodel_")[
+            : self.num_cameras
+        ]
         self.preview_active = False
+        self._capture_buffer = None
+
+        # Status/progress updates are coalesced and applied at most every ~16 ms
+        self._pending_status = None
+        self._pending_progress = None
+        self._ui_flush_timer = QTimer(self)
+        self._ui_flush_timer.setSingleShot(True)
+        self._ui_flush_timer.setInterval(16)
+        self._ui_flush_timer.timeout.connect(self._flush_ui_updates)
 
         self.setup_ui()
         self.update_instructions()
@@ -62,13 +109,13 @@ class CalibrationPage(QWizardPage):
 
         # Camera views section
         camera_group = QGroupBox("Camera Views")
+        camera_group.setStyleSheet(self._CAMERA_QSS)
         camera_layout = QGridLayout()
 
         self.camera_views = []
         self.camera_status_labels = []
-        num_cameras = CameraSetup.get_num_cameras(self.camera_setup)
 
-        for i in range(num_cameras):
+        for i in range(self.num_cameras):
             container = QWidget()
             container_layout = QVBoxLayout(container)
 
@@ -173,12 +220,18 @@ class CalibrationPage(QWizardPage):
 
     def toggle_preview(self):
         if not self.preview_active:
-            success = True
-            for i, camera_view in enumerate(self.camera_views):
-                if not camera_view.start():
-                    success = False
-                    break
-                else:
+            # Open every device up front so their open latencies overlap;
+            # starting the views afterwards only attaches to running cameras
+            failed = self.camera_server.open_all(range(len(self.camera_views)))
+            for i in failed:
+                self.update_camera_status(i, "Camera failed to start")
+
+            success = not failed
+            if success:
+                for i, camera_view in enumerate(self.camera_views):
+                    if not camera_view.start():
+                        success = False
+                        break
                     self.update_camera_status(i, "Camera active")
 
             if success:
@@ -187,7 +240,10 @@ class CalibrationPage(QWizardPage):
                 self.calibrate_btn.setEnabled(True)
                 self.calibration_viewmodel.set_preview_active(True)
             else:
-                self.status_label.setText("Failed to start all cameras")
+                # Don't leave the cameras that did open running
+                for camera_view in self.camera_views:
+                    camera_view.stop()
+                self.update_status("Failed to start all cameras")
         else:
             # Stop all cameras
             for i, camera_view in enumerate(self.camera_views):
@@ -218,15 +274,23 @@ class CalibrationPage(QWizardPage):
 
     def capture_new_view(self):
         """
-        Grab frames from each camera and send to the ViewModel for detection & storage.
+        Grab one synchronized set of frames and send it to the ViewModel for
+        detection & storage. Frames are written into one (N, H, W, C) buffer
+        that is reused across captures; it is (re)allocated from the frame geometry.
         """
-        frames = []
-        for i, camera_view in enumerate(self.camera_views):
-            frame = camera_view.get_current_frame()
-            if frame is None:
-                self.update_status(f"Failed to capture frame from camera {i+1}")
-                return
-            frames.append(frame)
+        n_cameras = len(self.camera_views)
+        frames = self.camera_server.snapshot(range(n_cameras), out=self._capture_buffer)
+        if frames is None:
+            self.update_status("Failed to capture frames from all cameras")
+            return
+
+        if (
+            self._capture_buffer is None
+            or self._capture_buffer.shape[1:] != frames[0].shape
+        ):
+            self._capture_buffer = np.empty(
+                (n_cameras,) + frames[0].shape, dtype=frames[0].dtype
+            )
 
         self.calibration_viewmodel.process_frames(frames)
 
@@ -256,13 +320,15 @@ class CalibrationPage(QWizardPage):
         """Update guidance message displayed to the user."""
         # We might add a separate label for guidance if you like
         # For now, let's just reuse the status_label or a new label
-        self.status_label.setText(guidance)
+        self.update_status(guidance)
 
     def handle_calibration_complete(self, success: bool, message: str, results: dict):
         """Handle calibration completion signal from the ViewModel."""
-        self.status_label.setText(message)
+        self.update_status(message)
         self.calibrate_btn.setEnabled(True)
-        self.progress_bar.setVisible(False)
+        # A failed solve keeps the session open for more views
+        if success:
+            self.progress_bar.setVisible(False)
 
         if success and results:
             results_text = self._format_calibration_results(results)
@@ -276,103 +342,90 @@ class CalibrationPage(QWizardPage):
 
     def _format_calibration_results(self, results: dict) -> str:
         """Format calibration results for display."""
-        text = "Calibration Results:\n\n"
+        lines = ["Calibration Results:", ""]
         if "overall_rms" in results:
-            text += f"Overall RMS Error: {results['overall_rms']:.3f} px\n\n"
+            lines += [f"Overall RMS Error: {results['overall_rms']:.3f} px", ""]
 
-        if "overall_rms_mm" in results:
-            text += (
-                f"Overall RMS Error (real-world): {results['overall_rms_mm']:.3f} mm\n"
+        if results.get("overall_rms_mm") is not None:
+            lines.append(
+                f"Overall RMS Error (real-world): {results['overall_rms_mm']:.3f} mm"
             )
 
         if "per_camera" in results:
-            text += "Per-Camera Results:\n"
+            lines.append("Per-Camera Results:")
             for cam_id, stats in results["per_camera"].items():
-                text += f"\nCamera {cam_id}:\n"
-                text += f"- RMS Error: {stats['rms']:.3f} px\n"
-                text += f"- Valid Views: {stats.get('n_views', 0)}\n"
+                lines += [
+                    "",
+                    f"Camera {cam_id}:",
+                    f"- RMS Error: {stats['rms']:.3f} px",
+                    f"- Valid Views: {stats.get('n_views', 0)}",
+                ]
         if "baseline" in results:
-            text += "\nCamera Baselines:\n"
-            for pair, distance in results["baseline"].items():
-                text += f"Cameras {pair}: {distance:.2f} mm\n"
-        return text
+            lines += ["", "Camera Baselines:"]
+            lines += [
+                f"Cameras {pair}: {distance:.2f} mm"
+                for pair, distance in results["baseline"].items()
+            ]
+        lines.append("")
+        return "\n".join(lines)
 
     def update_status(self, status: str):
-        """Update the status message from the ViewModel."""
-        self.status_label.setText(status)
+        """Queue a status message; only the latest one is shown on flush."""
+        self._pending_status = status
+        self._schedule_ui_flush()
 
     def update_progress(self, value: int):
-        """Update the progress bar from the ViewModel."""
-        self.progress_bar.setValue(value)
+        """Queue a progress bar value; only the latest one is shown on flush."""
+        self._pending_progress = value
+        self._schedule_ui_flush()
+
+    def _schedule_ui_flush(self):
+        if not self._ui_flush_timer.isActive():
+            self._ui_flush_timer.start()
+
+    def _flush_ui_updates(self):
+        """Apply the pending status and progress in one repaint."""
+        if self._pending_status is not None:
+            self.status_label.setText(self._pending_status)
+            self._pending_status = None
+        if self._pending_progress is not None:
+            self.progress_bar.setValue(self._pending_progress)
+            self._pending_progress = None
 
     def _update_camera_overlays(self, detections, quality):
         """
         Update camera views with detection overlays.
-        The data is passed from the ViewModel (points, metrics).
+        The data is passed from the ViewModel (2D points per camera, metrics).
         """
         try:
-            for i, camera_view in enumerate(self.camera_views):
-                # Default to "no points" (empty) and empty quality
-                detection_data = None
-                detection_quality = {}
-
-                # If we actually have a detection for camera i, use it
-                if i < len(detections) and isinstance(detections[i], tuple):
-                    detection_data = detections[i][0]  # the 2D points
-                    detection_quality = quality.get(i, {})
-
-                # Always call update_overlay, so cameras with no detection get cleared
-                camera_view.update_overlay(detection_data, detection_quality)
+            # Cameras past the end of `detections` get None, so every view is
+            # updated and cameras with no detection get cleared
+            points_per_camera = chain(detections, repeat(None))
+            for i, (camera_view, points) in enumerate(
+                zip(self.camera_views, points_per_camera)
+            ):
+                camera_view.update_overlay(points, quality.get(i, {}))
 
         except Exception as e:
-            print(f"Overlay error: {str(e)}")
-            self.status_label.setText(f"Error updating overlays: {str(e)}")
+            logger.exception("Overlay error")
+            self.update_status(f"Error updating overlays: {str(e)}")
 
     def create_camera_view(self, camera_id):
         """Create a camera view widget."""
-        camera_view = CameraView(
-            self.locator.get_service(f"camera_viewmodel_{camera_id}")
-        )
+        camera_view = CameraView(self.camera_viewmodels[camera_id])
         camera_view.setMinimumSize(640, 480)
-        camera_view.setStyleSheet(
-            """
-            QLabel {
-                background-color: black;
-                border: 1px solid #666;
-                color: white;
-            }
-            """
-        )
         self.camera_views.append(camera_view)
         return camera_view
 
     def update_instructions(self):
         """Update instructions based on target type."""
-        instructions = "1. Click 'Preview All Cameras' to start camera feeds\n\n"
-
-        if self.target_type == CalibrationTarget.CUBE.value:
-            instructions += (
-                "2. Place the calibration cube in the working volume\n"
-                "3. Ensure the cube is visible in all cameras\n"
-                "4. Check that cube corners are well-lit and visible\n"
-                "5. Click 'Start Calibration' when ready (and follow instructions)"
-            )
-        else:  # CHECKERBOARD
-            instructions += (
-                "2. Hold the checkerboard in the working volume\n"
-                "3. Ensure the pattern is fully visible\n"
-                "4. Avoid reflections and ensure good lighting\n"
-                "5. Click 'Start Calibration' when ready (and follow instructions)"
-            )
-
-        self.instructions_label.setText(instructions)
+        self.instructions_label.setText(
+            _INSTRUCTIONS.get(self.target_type, _CHECKERBOARD_INSTRUCTIONS)
+        )
 
     def isComplete(self) -> bool:
         """
         If you want the wizard to proceed automatically, we check
         the calibration_viewmodel.calibration_successful flag.
         """
-        return (
-            hasattr(self.calibration_viewmodel, "calibration_successful")
-            and self.calibration_viewmodel.calibration_successful
-        )
+        return self.calibration_viewmodel.calibration_successful
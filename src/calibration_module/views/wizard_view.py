@@ -22,7 +22,4 @@ class CalibrationWizard(QWizard):
         self.addPage(CalibrationPage())
 
     def connect_signals(self):
-        if hasattr(self.viewmodel, "handle_wizard_finished"):
-            self.finished.connect(self.viewmodel.handle_wizard_finished)
-        else:
-            print("Warning: WizardViewModel missing handle_wizard_finished method")
+        self.finished.connect(self.viewmodel.handle_wizard_finished)
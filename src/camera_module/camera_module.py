@@ -1,3 +1,4 @@
+from camera_module.camera_server import CameraServer
 from camera_module.models.camera_model import CameraModel
 from camera_module.viewmodels.camera_viewmodel import CameraViewModel
 from services.service_locator import ServiceLocator
@@ -15,6 +16,12 @@ class CameraModule:
         self.camera_viewmodels = []
 
     def initialize(self):
+        # One server owns all capture devices; models fetch frames from it
+        self.camera_server = CameraServer()
+        ServiceLocator.get_instance().register_service(
+            "camera_server", self.camera_server
+        )
+
         # Create models for each camera
         for i in range(self._number_of_cameras):
             model = CameraModel(i)
@@ -30,9 +37,10 @@ class CameraModule:
 
     def _register_services(self):
         """Register all camera components with the service locator."""
-        locator = ServiceLocator.get_instance()
+        services = {}
         for i, (model, viewmodel) in enumerate(
             zip(self.camera_models, self.camera_viewmodels)
         ):
-            locator.register_service(f"camera_model_{i}", model)
-            locator.register_service(f"camera_viewmodel_{i}", viewmodel)
+            services[f"camera_model_{i}"] = model
+            services[f"camera_viewmodel_{i}"] = viewmodel
+        ServiceLocator.get_instance().register_services(services)
@@ -0,0 +1,254 @@
+# src/camera_module/camera_server.py
+import multiprocessing
+import time
+import weakref
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+# Frames per camera ring; a slot is only rewritten FRAME_SLOTS - 1 frames after
+# it was published, so a reader has that long to use the view it got
+FRAME_SLOTS = 3
+OPEN_TIMEOUT_S = 10.0
+SNAPSHOT_TIMEOUT_S = 1.0
+STOP_TIMEOUT_S = 2.0
+
+
+def _capture_worker(camera_id, conn, latest_seq, frame_event, stop_event):
+    """
+    Capture process entry point. Owns the VideoCapture, reports the frame
+    shape, then decodes BGR frames straight into the shared ring named by
+    the parent, setting frame_event after each one is published.
+    """
+    # Only the capture process needs OpenCV
+    import cv2
+
+    cap = cv2.VideoCapture(camera_id)
+    ret, frame = cap.read() if cap.isOpened() else (False, None)
+    if not ret:
+        cap.release()
+        conn.send(None)
+        return
+    conn.send(frame.shape)
+
+    shm = shared_memory.SharedMemory(name=conn.recv())
+    slots = np.ndarray((FRAME_SLOTS,) + frame.shape, dtype=np.uint8, buffer=shm.buf)
+    # Publish the handshake frame so a frame is available as soon as open() returns
+    seq = 1
+    slots[seq] = frame
+    latest_seq.value = seq
+    frame_event.set()
+    conn.send(True)
+    try:
+        while not stop_event.is_set():
+            if not cap.grab():
+                # Back off instead of spinning while the device is unavailable
+                time.sleep(0.01)
+                continue
+            # Decode straight into the next shared slot. Frames stay BGR;
+            # only consumers that need RGB pay for the conversion.
+            target = slots[(seq + 1) % FRAME_SLOTS]
+            ret, frame = cap.retrieve(target)
+            if not ret or frame.shape != target.shape:
+                continue
+            if not np.may_share_memory(frame, target):
+                target[...] = frame
+            seq += 1
+            latest_seq.value = seq
+            frame_event.set()
+    finally:
+        del slots
+        shm.close()
+        cap.release()
+
+
+class CameraServer:
+    """
+    Owns every capture device in the application. Each open camera is read by
+    its own process, which decodes BGR frames into a shared-memory ring;
+    latest() hands out views into that ring, so frames never cross a pipe or
+    the GIL.
+    """
+
+    def __init__(self):
+        # spawn: forking a process that already runs Qt threads is unsafe
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: Dict[int, multiprocessing.Process] = {}
+        self._stop_events: Dict[int, object] = {}
+        self._latest_seq: Dict[int, object] = {}
+        self._frame_events: Dict[int, object] = {}
+        self._shms: Dict[int, shared_memory.SharedMemory] = {}
+        self._slots: Dict[int, np.ndarray] = {}
+        # Closed segments, kept mapped while frames handed out still view them
+        self._retired_shms: List[Tuple[weakref.ref, shared_memory.SharedMemory]] = []
+
+    def open(self, camera_id: int):
+        """Start the capture process for a camera; no-op if already open."""
+        if self.open_all([camera_id]):
+            raise Exception("Could not open camera")
+
+    def open_all(self, camera_ids) -> List[int]:
+        """
+        Open several cameras at once. Every capture process is launched before
+        waiting on any of them, so the device-open latencies overlap.
+        Returns the ids that could not be opened.
+        """
+        launched = {
+            camera_id: self._launch(camera_id)
+            for camera_id in camera_ids
+            if camera_id not in self._processes
+        }
+        return [
+            camera_id
+            for camera_id, pending in launched.items()
+            if not self._finish_open(camera_id, *pending)
+        ]
+
+    def snapshot(self, camera_ids, out=None) -> Optional[List[np.ndarray]]:
+        """
+        RGB frames from several cameras taken as close together as possible.
+        Waits until every camera has delivered a frame after this call, then
+        converts them all in one pass; into out[i] where the shape matches.
+        Returns None if a camera is not open or no fresh frame arrives in time.
+        """
+        import cv2
+
+        camera_ids = list(camera_ids)
+        if any(camera_id not in self._processes for camera_id in camera_ids):
+            return None
+
+        start_seqs = [self.frame_seq(camera_id) for camera_id in camera_ids]
+        deadline = time.monotonic() + SNAPSHOT_TIMEOUT_S
+        while any(
+            self.frame_seq(camera_id) == seq
+            for camera_id, seq in zip(camera_ids, start_seqs)
+        ):
+            if time.monotonic() > deadline:
+                return None
+            time.sleep(0.001)
+
+        # The BGR to RGB conversion doubles as the copy out of the ring
+        return [
+            cv2.cvtColor(
+                self.latest(camera_id),
+                cv2.COLOR_BGR2RGB,
+                dst=out[i] if out is not None else None,
+            )
+            for i, camera_id in enumerate(camera_ids)
+        ]
+
+    def _launch(self, camera_id: int):
+        conn, child_conn = self._context.Pipe()
+        stop_event = self._context.Event()
+        latest_seq = self._context.Value("q", 0)
+        frame_event = self._context.Event()
+        process = self._context.Process(
+            target=_capture_worker,
+            args=(camera_id, child_conn, latest_seq, frame_event, stop_event),
+            name=f"camera-{camera_id}-capture",
+            daemon=True,
+        )
+        process.start()
+        return process, conn, stop_event, latest_seq, frame_event
+
+    def _finish_open(
+        self, camera_id, process, conn, stop_event, latest_seq, frame_event
+    ) -> bool:
+        """Complete the shared-memory handshake; False if the camera failed."""
+        shape = conn.recv() if conn.poll(OPEN_TIMEOUT_S) else None
+        if shape is None:
+            self._stop_process(process, stop_event)
+            return False
+
+        shm = shared_memory.SharedMemory(
+            create=True, size=FRAME_SLOTS * int(np.prod(shape))
+        )
+        conn.send(shm.name)
+        if not (conn.poll(OPEN_TIMEOUT_S) and conn.recv()):
+            self._stop_process(process, stop_event)
+            shm.close()
+            shm.unlink()
+            return False
+
+        self._processes[camera_id] = process
+        self._stop_events[camera_id] = stop_event
+        self._latest_seq[camera_id] = latest_seq
+        self._frame_events[camera_id] = frame_event
+        self._shms[camera_id] = shm
+        self._slots[camera_id] = np.ndarray(
+            (FRAME_SLOTS,) + tuple(shape), dtype=np.uint8, buffer=shm.buf
+        )
+        return True
+
+    def close(self, camera_id: int):
+        """Stop the capture process and free its shared memory."""
+        if camera_id not in self._processes:
+            return
+        self._stop_process(
+            self._processes.pop(camera_id), self._stop_events.pop(camera_id)
+        )
+        del self._latest_seq[camera_id]
+        del self._frame_events[camera_id]
+        shm = self._shms.pop(camera_id)
+        shm.unlink()
+        # Every view from latest() keeps the ring array alive through .base
+        ring_ref = weakref.ref(self._slots.pop(camera_id))
+        self._retired_shms.append((ring_ref, shm))
+        self._release_retired()
+
+    def close_all(self):
+        # Signal every capture process first so they shut down concurrently
+        for stop_event in self._stop_events.values():
+            stop_event.set()
+        for camera_id in list(self._processes):
+            self.close(camera_id)
+
+    def frame_seq(self, camera_id: int) -> int:
+        """Sequence number of the latest frame; 0 until the first one arrives."""
+        latest_seq = self._latest_seq.get(camera_id)
+        return latest_seq.value if latest_seq is not None else 0
+
+    def wait_for_frame(
+        self, camera_id: int, last_seq: int, timeout: float
+    ) -> Optional[int]:
+        """
+        Block until camera_id publishes a frame newer than last_seq, or until
+        timeout seconds pass. Returns the latest sequence number, or None once
+        the camera is closed. Safe to call from a thread other than the owner's.
+        """
+        frame_event = self._frame_events.get(camera_id)
+        if frame_event is None:
+            return None
+        if self.frame_seq(camera_id) == last_seq:
+            frame_event.wait(timeout)
+            # A frame published right after the wait still shows in the seq read
+            frame_event.clear()
+        return self.frame_seq(camera_id)
+
+    def latest(self, camera_id: int) -> Optional[np.ndarray]:
+        """
+        View of the most recent BGR frame for camera_id, or None if there is
+        none yet. The view is overwritten after FRAME_SLOTS - 1 further frames;
+        copy it to keep it.
+        """
+        seq = self.frame_seq(camera_id)
+        if seq == 0:
+            return None
+        return self._slots[camera_id][seq % FRAME_SLOTS]
+
+    def _release_retired(self):
+        """Unmap closed segments once no frame views reference them anymore."""
+        still_referenced = []
+        for ring_ref, shm in self._retired_shms:
+            if ring_ref() is None:
+                shm.close()
+            else:
+                still_referenced.append((ring_ref, shm))
+        self._retired_shms = still_referenced
+
+    def _stop_process(self, process, stop_event):
+        stop_event.set()
+        process.join(STOP_TIMEOUT_S)
+        if process.is_alive():
+            process.terminate()
+            process.join()
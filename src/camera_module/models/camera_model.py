@@ -1,25 +1,59 @@
 # src/models/camera_model.py
-import cv2
-import numpy as np
-from PySide6.QtCore import QObject, Signal
+import threading
+from PySide6.QtCore import QObject, QThread, Qt, Signal
+from services.service_locator import ServiceLocator
+
+FRAME_WAIT_TIMEOUT_S = 0.1
+
+
+class FrameWatcher(QThread):
+    """Waits on the camera server for new frames and reports them."""
+
+    frame_arrived = Signal()
+
+    def __init__(self, camera_server, camera_id, delivery_pending):
+        super().__init__()
+        self.camera_server = camera_server
+        self.camera_id = camera_id
+        self.delivery_pending = delivery_pending
+
+    def run(self):
+        seq = 0
+        while not self.isInterruptionRequested():
+            new_seq = self.camera_server.wait_for_frame(
+                self.camera_id, seq, FRAME_WAIT_TIMEOUT_S
+            )
+            if new_seq is None:
+                break  # Camera closed
+            if new_seq == seq:
+                continue
+            seq = new_seq
+            # While the last report is still queued, newer frames need no report
+            # of their own: the GUI reads the newest frame when it gets to it
+            if not self.delivery_pending.is_set():
+                self.delivery_pending.set()
+                self.frame_arrived.emit()
 
 
 class CameraModel(QObject):
-    frame_ready = Signal(np.ndarray)
+    frame_ready = Signal(object)  # BGR frame, only valid during the emit
     error_occurred = Signal(str)
     status_changed = Signal(str)
 
     def __init__(self, camera_id=0):
         super().__init__()
         self.camera_id = camera_id
-        self.camera = None
+        self.camera_server = ServiceLocator.get_instance().get_service(
+            "camera_server"
+        )
         self.is_running = False
+        self._delivery_pending = threading.Event()
+        self._watcher = None
 
     def start(self):
         try:
-            self.camera = cv2.VideoCapture(self.camera_id)
-            if not self.camera.isOpened():
-                raise Exception("Could not open camera")
+            self.camera_server.open(self.camera_id)
+            self._start_watcher()
 
             self.is_running = True
             self.status_changed.emit("Camera running")
@@ -30,16 +64,69 @@ class CameraModel(QObject):
             return False
 
     def stop(self):
-        if self.camera is not None:
-            self.camera.release()
+        self._stop_watcher()
+        self.camera_server.close(self.camera_id)
         self.is_running = False
         self.status_changed.emit("Camera stopped")
 
-    def get_frame(self):
-        if self.camera is None or not self.camera.isOpened():
+    def _start_watcher(self):
+        if self._watcher is not None:
+            return
+        self._delivery_pending.clear()
+        self._watcher = FrameWatcher(
+            self.camera_server, self.camera_id, self._delivery_pending
+        )
+        self._watcher.frame_arrived.connect(
+            self._deliver_frame, Qt.ConnectionType.QueuedConnection
+        )
+        self._watcher.start()
+
+    def _stop_watcher(self):
+        if self._watcher is None:
+            return
+        self._watcher.requestInterruption()
+        self._watcher.wait()
+        self._watcher = None
+
+    def _deliver_frame(self):
+        """Emit the newest frame on the GUI thread, as reported by the watcher."""
+        # Re-arm first so a frame published while we read gets reported too
+        self._delivery_pending.clear()
+        frame = self.get_frame()
+        if frame is not None:
+            self.frame_ready.emit(frame)
+
+    def frame_seq(self) -> int:
+        """Sequence number of the latest frame, for detecting new frames."""
+        return self.camera_server.frame_seq(self.camera_id)
+
+    def get_frame(self, out=None):
+        """
+        Return the most recent BGR frame from the camera server.
+        The returned array is a view into shared memory that the capture
+        process reuses a few frames later; copy it (or pass `out`) to keep it.
+        Args:
+            out: Optional preallocated array to copy into; the shared frame is
+                returned instead if its shape does not match.
+        """
+        frame = self.camera_server.latest(self.camera_id)
+        if frame is None:
             return None
 
-        ret, frame = self.camera.read()
-        if ret:
-            return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        return None
+        if out is not None and out.shape == frame.shape:
+            out[...] = frame
+            return out
+        return frame
+
+    def get_rgb_frame(self, out=None):
+        """Most recent frame converted to RGB, for consumers that need RGB."""
+        frame = self.camera_server.latest(self.camera_id)
+        return bgr_to_rgb(frame, out) if frame is not None else None
+
+
+def bgr_to_rgb(frame, out=None):
+    """Convert a BGR frame to RGB, into `out` when its shape matches."""
+    # Imported here so importing the camera package does not load OpenCV
+    import cv2
+
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=out)
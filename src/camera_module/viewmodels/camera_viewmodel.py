@@ -1,11 +1,12 @@
 # src/viewmodels/camera_viewmodel.py
-from PySide6.QtCore import QObject, Signal, QTimer
+from PySide6.QtCore import QObject, Signal
 from services.service_locator import ServiceLocator
+from camera_module.models.camera_model import bgr_to_rgb
 
 
 class CameraViewModel(QObject):
 
-    frame_ready = Signal(object)  # Will emit processed frame for UI
+    frame_updated = Signal(object)  # Frame to display (live or frozen)
     status_changed = Signal(str)
     error_occurred = Signal(str)
     point_selected = Signal(float, float)
@@ -13,46 +14,41 @@ class CameraViewModel(QObject):
     def __init__(self, camera_model):
         super().__init__()
         self.camera_model = camera_model
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_frame)
 
         self.frozen_frame = None  # Add this to store frozen frame
         self.is_frozen = False  # Add freeze state
-        # Connect model signals
+        # Connect model signals; live frames go straight through unless frozen
+        self.camera_model.frame_ready.connect(self.frame_updated)
         self.camera_model.status_changed.connect(self.status_changed)
         self.camera_model.error_occurred.connect(self.error_occurred)
 
     def start_camera(self):
-        if self.camera_model.start():
-            self.timer.start(30)  # 30ms = ~33fps
-            return True
-        return False
+        return self.camera_model.start()
 
     def stop_camera(self):
-        self.timer.stop()
         self.camera_model.stop()
 
-    def update_frame(self):
-        frame = self.camera_model.get_frame()
-        if frame is not None:
-            self.frame_ready.emit(frame)
-
-    def capture_frame(self):
-        """Get current frame (frozen or live)"""
+    def capture_frame(self, out=None):
+        """Get current frame (frozen or live) as RGB, optionally into `out`"""
         if self.is_frozen and self.frozen_frame is not None:
-            return self.frozen_frame
-        return self.camera_model.get_frame()
+            return bgr_to_rgb(self.frozen_frame, out)
+        return self.camera_model.get_rgb_frame(out=out)
 
     def freeze_frame(self):
         """Freeze the current frame"""
+        if not self.is_frozen:
+            # Stop live frames at the source instead of filtering each one
+            self.camera_model.frame_ready.disconnect(self.frame_updated)
         self.is_frozen = True
-        self.frozen_frame = self.camera_model.get_frame()
-        self.timer.stop()
+        # Copy: the live frame is a view the capture process will overwrite
+        frame = self.camera_model.get_frame()
+        self.frozen_frame = frame.copy() if frame is not None else None
         if self.frozen_frame is not None:
-            self.frame_ready.emit(self.frozen_frame)
+            self.frame_updated.emit(self.frozen_frame)
 
     def unfreeze_frame(self):
         """Resume live preview"""
+        if self.is_frozen:
+            self.camera_model.frame_ready.connect(self.frame_updated)
         self.is_frozen = False
         self.frozen_frame = None
-        self.timer.start(30)
@@ -1,11 +1,60 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PySide6.QtGui import QImage, QPixmap, QPainter, QPen, QColor
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QStyle
+from PySide6.QtGui import QImage, QPainter, QPen, QColor, QPicture
+from PySide6.QtCore import Qt, QRect, QTimer
 import numpy as np
+import cv2
 from services.service_locator import ServiceLocator
 
+# Detection colors by quality: poor (red), warning (yellow), good (green)
+_QUALITY_COLORS = (QColor(255, 0, 0), QColor(255, 255, 0), QColor(0, 255, 0))
+_QUALITY_PENS = {color.rgb(): QPen(color, 2) for color in _QUALITY_COLORS}
+_MARKER_PEN = QPen(QColor(255, 0, 0), 2)  # Red pen
+
+
+class _OverlayLabel(QLabel):
+    """
+    QLabel that paints a frame image itself, without converting it to a
+    QPixmap, and lets its owner paint an overlay on top of it
+    """
+
+    def __init__(self, text, paint_overlay):
+        super().__init__(text)
+        self._paint_overlay = paint_overlay
+        self.image = None
+
+    def set_image(self, image):
+        """Show image instead of text; None goes back to showing text"""
+        if image is not None and self.text():
+            self.setText("")
+        self.image = image
+        self.update()
+
+    def image_rect(self):
+        """Where the image is drawn, in label coordinates; empty when showing text"""
+        if self.image is None:
+            return QRect()
+        return QStyle.alignedRect(
+            self.layoutDirection(),
+            self.alignment(),
+            self.image.size(),
+            self.contentsRect(),
+        )
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.image is None:
+            return
+        painter = QPainter(self)
+        try:
+            painter.drawImage(self.image_rect().topLeft(), self.image)
+            self._paint_overlay(painter)
+        finally:
+            painter.end()
+
 
 class CameraView(QWidget):
+    NOT_STARTED_TEXT = "Camera Not Started"
+
     def __init__(self, view_model, parent=None):
         """
         Initialize a camera view widget that can display camera frames
@@ -18,27 +67,64 @@ class CameraView(QWidget):
         self.current_frame = None
         self.current_detection = None
         self.current_quality = None
-        self.current_pixmap = None  # Add this line
+        self.current_image = None  # The frame as shown, scaled to the label
+        self.marked_point = None  # Last selected point, in image coordinates
+        # Overlay recorded in label coordinates, replayed on every paint; it is
+        # re-recorded when marked dirty or when the frame moves or rescales
+        self._overlay_picture = QPicture()
+        self._overlay_dirty = False
+        self._overlay_key = None
+        # Our own copy of the shown frame, since live frames are ring views
+        # the capture process overwrites; reallocated only when the shape changes
+        self._frame_buf = None
+        # Scaled frame, plus a copy padded to 32 bits per pixel; reallocated
+        # only when the display size changes
+        self._scaled_buf = None
+        self._display_buf = None
+        # Display size / image size of the shown frame, updated on each rescale
+        self._scale_factor = 1.0
         self.preview_active = False
+        # Looked up on first click: views can be built before it is registered
+        self._measurement_vm = None
 
         # Create a vertical layout with no margins for maximum display space
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
         # Create a label that will display either status text or camera frames
-        self.display_label = QLabel("Camera Not Started")
+        self.display_label = _OverlayLabel(self.NOT_STARTED_TEXT, self._paint_overlay)
         self.display_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.display_label.setStyleSheet("color: white; font-size: 14px;")
         layout.addWidget(self.display_label)
 
-        # Connect the view model's signal to our frame handler
-        self.view_model.frame_ready.connect(self.handle_frame)
+        # Bursts of errors are coalesced; only the latest is shown every ~100 ms
+        self._pending_error = None
+        self._error_timer = QTimer(self)
+        self._error_timer.setSingleShot(True)
+        self._error_timer.setInterval(100)
+        self._error_timer.timeout.connect(self._show_pending_error)
+
+        # While the view is being resized frames are scaled with the cheap
+        # filter; the frame is redrawn properly once resizing settles
+        self._resizing = False
+        self._resize_settle_timer = QTimer(self)
+        self._resize_settle_timer.setSingleShot(True)
+        self._resize_settle_timer.setInterval(150)
+        self._resize_settle_timer.timeout.connect(self._on_resize_settled)
+        # Resize events only schedule a redraw, so a burst of them costs one
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(0)
+        self._redraw_timer.timeout.connect(self._redraw_current_frame)
+
+        # Frames are pushed as the camera delivers them
+        self.view_model.frame_updated.connect(self._on_frame_updated)
         self.view_model.error_occurred.connect(self.handle_error)
 
     def start(self):
         """Start continuous camera preview"""
         if not self.view_model.start_camera():
-            self.display_label.setText(f"Failed to start camera")
+            self._set_text("Failed to start camera")
             return False
         self.preview_active = True  # Set flag when preview starts
         return True
@@ -46,60 +132,94 @@ class CameraView(QWidget):
     def stop(self):
         self.preview_active = False
         self.view_model.stop_camera()
-        self.display_label.setText("Camera Not Started")
-        self.current_frame = None
+        self._set_text(self.NOT_STARTED_TEXT)
 
-    def get_current_frame(self):
+    def get_current_frame(self, out=None):
+        """
+        Grab the current frame.
+        Args:
+            out: Optional preallocated array the frame is written into when the
+                shape matches (the returned array may still be a new one)
+        """
         if not self.preview_active:
             if self.view_model.start_camera():
-                frame = self.view_model.capture_frame()
+                frame = self.view_model.capture_frame(out=out)
                 self.view_model.stop_camera()
                 return frame
         else:
             # If already previewing, just get the current frame
-            return self.view_model.capture_frame()
+            return self.view_model.capture_frame(out=out)
         return None
 
+    def _on_frame_updated(self, frame):
+        """Display frames from the view model while previewing."""
+        if self.preview_active:
+            self.handle_frame(frame)
+
     def handle_frame(self, frame):
         """
         Handle a new frame received from the view model
         Args:
-            frame: numpy.ndarray containing the image data
+            frame: numpy.ndarray containing the BGR image data. Live frames are
+                views into the camera's shared ring and get overwritten a few
+                frames later, so the frame is copied into a view-owned buffer
+                that redraws and the overlay can go back to
         """
-        self.current_frame = frame
-        self.display_frame(frame)
+        if self.marked_point is not None:
+            self.marked_point = None
+            self._overlay_dirty = True
+        if self._frame_buf is None or self._frame_buf.shape != frame.shape:
+            self._frame_buf = np.empty_like(frame)
+        np.copyto(self._frame_buf, frame)
+        self.current_frame = self._frame_buf
+        self.display_frame(self._frame_buf)
 
-    # In camera_view.py - Update display_frame method
     def display_frame(self, frame):
-        """Convert a numpy frame to QPixmap and display it in our label"""
-        height, width, channel = frame.shape
-        bytes_per_line = channel * width
-
-        # Convert numpy array to QImage
-        q_image = QImage(
-            frame.data, width, height, bytes_per_line, QImage.Format.Format_RGB888
-        )
-
-        # Create the base pixmap from the frame
-        self.current_pixmap = QPixmap.fromImage(q_image)
-
-        # Scale pixmap
-        scaled_pixmap = self.current_pixmap.scaled(
-            self.display_label.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
+        """Scale a BGR numpy frame to our label and display it"""
+        height, width = frame.shape[:2]
+        display_w, display_h = self._display_size(width, height)
+        scaled_shape = (display_h, display_w, 3)
+        if self._scaled_buf is None or self._scaled_buf.shape != scaled_shape:
+            self._scaled_buf = np.empty(scaled_shape, dtype=np.uint8)
+            self._display_buf = np.empty((display_h, display_w, 4), dtype=np.uint8)
+            # BGRX is Qt's native RGB32 layout on little-endian hosts, so the
+            # label paints this image without any format conversion
+            self.current_image = QImage(
+                self._display_buf.data,
+                display_w,
+                display_h,
+                self._display_buf.strides[0],
+                QImage.Format.Format_RGB32,
+            )
+        self._scale_factor = display_w / width
+        cv2.resize(
+            frame,
+            (display_w, display_h),
+            dst=self._scaled_buf,
+            interpolation=self._interpolation(self._scale_factor),
         )
 
-        # Update label with the scaled pixmap
-        self.display_label.setPixmap(scaled_pixmap)
+        # Pad to BGRX in place; current_image views this buffer
+        cv2.cvtColor(self._scaled_buf, cv2.COLOR_BGR2BGRA, dst=self._display_buf)
+        self.display_label.set_image(self.current_image)
 
-        scaled_pixmap = self.current_pixmap.scaled(
-            self.display_label.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
+    def _display_size(self, width, height):
+        """Largest size with the frame's aspect ratio that fits in the label"""
+        label_w = self.display_label.width()
+        label_h = self.display_label.height()
+        scaled_w = label_h * width // height
+        if scaled_w <= label_w:
+            return max(scaled_w, 1), max(label_h, 1)
+        return max(label_w, 1), max(label_w * height // width, 1)
 
-        self.display_label.setPixmap(scaled_pixmap)
+    def _interpolation(self, scale):
+        """
+        Area filtering only pays off on a frozen frame that is not shrunk much;
+        on live frames or strong downscales it is not visible but costs the most
+        """
+        if self.view_model.is_frozen and not self._resizing and scale >= 0.75:
+            return cv2.INTER_AREA
+        return cv2.INTER_NEAREST
 
     def handle_error(self, error_message):
         """
@@ -107,7 +227,30 @@ class CameraView(QWidget):
         Args:
             error_message: String containing the error message
         """
-        self.display_label.setText(f"Error: {error_message}")
+        self._pending_error = error_message
+        if not self._error_timer.isActive():
+            self._error_timer.start()
+
+    def _show_pending_error(self):
+        if self._pending_error is not None:
+            self._set_text(f"Error: {self._pending_error}")
+            self._pending_error = None
+
+    def _set_text(self, text):
+        """
+        Show text in the label, skipping the relayout if it is already shown.
+        The frame and its overlay go with the image, so nothing redraws them
+        over the text; the next frame brings the view back
+        """
+        self.current_frame = None
+        self.current_detection = None
+        self.current_quality = None
+        self.marked_point = None
+        self._overlay_dirty = True
+        # A label showing a frame has empty text, so this still replaces frames
+        self.display_label.image = None
+        if self.display_label.text() != text:
+            self.display_label.setText(text)
 
     def closeEvent(self, event):
         """
@@ -125,7 +268,31 @@ class CameraView(QWidget):
             event: QResizeEvent from Qt
         """
         super().resizeEvent(event)
-        if self.current_frame is not None:
+        # Layout settling re-sends the size we already have
+        if event.size() == event.oldSize():
+            return
+        self._resizing = True
+        self._resize_settle_timer.start()
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start()
+
+    def _redraw_current_frame(self):
+        if self.current_frame is None:
+            return
+        # A resize that leaves the fitted frame size alone needs no rescale
+        height, width = self.current_frame.shape[:2]
+        if (
+            self.display_label.image is self.current_image
+            and self._scaled_buf is not None
+            and self._scaled_buf.shape[1::-1] == self._display_size(width, height)
+        ):
+            return
+        self.display_frame(self.current_frame)
+
+    def _on_resize_settled(self):
+        self._resizing = False
+        # Live frames arrive on their own; a frozen one is redrawn at full quality
+        if self.current_frame is not None and self.view_model.is_frozen:
             self.display_frame(self.current_frame)
 
     # In camera_view.py - Add to existing class
@@ -139,144 +306,128 @@ class CameraView(QWidget):
             elif isinstance(points, list):
                 has_points = len(points) > 0
 
-        # Store or clear detection
-        self.current_detection = points if has_points else None
+        old_rect = self._overlay_rect()
+        # Store or clear detection, as one (N, 2) array whatever shape it came in
+        self.current_detection = (
+            np.asarray(points, dtype=np.float32).reshape(-1, 2) if has_points else None
+        )
         self.current_quality = quality if has_points else None
+        self._overlay_dirty = True
 
-        # Force re-draw of the underlying (raw) frame
-        if self.current_frame is not None:
-            self.display_frame(self.current_frame)
-
-        # ALWAYS trigger update to remove old overlay
-        self.display_label.update()
-
-    def paintEvent(self, event):
-        """Override paint event"""
-        super().paintEvent(event)
-
-        # Only draw overlay if we have detection points and a pixmap
-        if (
-            self.current_detection is not None
-            and self.current_pixmap is not None
-            and len(self.current_detection) > 0
-        ):  # Added length check
-
-            # Create working copy of current pixmap
-            working_pixmap = self.current_pixmap.copy()
-            painter = QPainter(working_pixmap)
-
-            for point in self.current_detection:
-                # Handle numpy array points
-                if isinstance(point, np.ndarray):
-                    if point.shape == (1, 2):
-                        x = int(point[0][0])
-                        y = int(point[0][1])
-                    elif point.shape == (2,):
-                        x = int(point[0])
-                        y = int(point[1])
-                    else:
-                        continue
-
-                    # Get color based on quality
-                    if self.current_quality:
-                        color = self._get_quality_color(
-                            self.current_quality.get("score", 0)
-                        )
-                    else:
-                        color = QColor(0, 255, 0)  # Default to green
-
-                    painter.setPen(QPen(color, 2))
-                    painter.drawEllipse(x - 3, y - 3, 6, 6)
-
-            painter.end()
-
-            # Scale and display the working pixmap
-            scaled_pixmap = working_pixmap.scaled(
-                self.display_label.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            self.display_label.setPixmap(scaled_pixmap)
+        # Repaint only where the old or new overlay is
+        self.display_label.update(old_rect.united(self._overlay_rect()))
 
-    def _draw_detection_overlay(self):
-        """Draw detection points and quality indicators"""
-        if not hasattr(self, "current_detection"):
+    def _paint_overlay(self, painter):
+        """Draw the recorded overlay over the label's frame"""
+        if self.display_label.image is None:
             return
+        key = (self._frame_rect(), self._scale_factor)
+        if self._overlay_dirty or key != self._overlay_key:
+            self._record_overlay()
+            self._overlay_key = key
+            self._overlay_dirty = False
+        painter.drawPicture(0, 0, self._overlay_picture)
+
+    def _record_overlay(self):
+        """Record detection points and the selected point into the overlay"""
+        self._overlay_picture = QPicture()
+        recorder = QPainter(self._overlay_picture)
+        try:
+            if self.current_detection is not None:
+                self._draw_detection_overlay(recorder)
+            if self.marked_point is not None:
+                self._draw_marker(recorder, *self.marked_point)
+        finally:
+            recorder.end()
 
-        painter = QPainter(self.display_label)
-        if not painter.begin(self.display_label):
-            return
+    def _draw_detection_overlay(self, painter):
+        """Draw detection points and quality indicators"""
+        scale_factor = self._calculate_scale_factor()
+        origin = self._frame_rect().topLeft()
 
-        try:
-            # Scale points to match displayed image size
-            scale_factor = self._calculate_scale_factor()
+        # Quality-based color, the same for every point
+        if self.current_quality:
+            color = self._get_quality_color(self.current_quality.get("score", 0))
+        else:
+            color = _QUALITY_COLORS[2]  # Default to green
+        painter.setPen(_QUALITY_PENS[color.rgb()])
+
+        # Top-left corners of the 6x6 point circles, in label coordinates
+        corners = (self.current_detection * scale_factor).astype(np.int32)
+        corners += (origin.x() - 3, origin.y() - 3)
+        for x, y in corners.tolist():
+            painter.drawEllipse(x, y, 6, 6)
+
+    def _draw_marker(self, painter, x: float, y: float):
+        """Draw a crosshair at an image point"""
+        scale_factor = self._calculate_scale_factor()
+        origin = self._frame_rect().topLeft()
+        cx = int(origin.x() + x * scale_factor)
+        cy = int(origin.y() + y * scale_factor)
+
+        painter.setPen(_MARKER_PEN)
+        size = 10
+        painter.drawLine(cx - size, cy, cx + size, cy)
+        painter.drawLine(cx, cy - size, cx, cy + size)
+
+    def _overlay_rect(self):
+        """Label area the overlay currently covers, padded for the pen width"""
+        rect = QRect()
+        if self.display_label.image is None:
+            return rect
+        scale_factor = self._calculate_scale_factor()
+        origin = self._frame_rect().topLeft()
+        if self.current_detection is not None:
+            x0, y0 = self.current_detection.min(axis=0) * scale_factor
+            x1, y1 = self.current_detection.max(axis=0) * scale_factor
+            rect = QRect(
+                origin.x() + int(x0) - 5,
+                origin.y() + int(y0) - 5,
+                int(x1) - int(x0) + 11,
+                int(y1) - int(y0) + 11,
+            )
+        if self.marked_point is not None:
+            cx = origin.x() + int(self.marked_point[0] * scale_factor)
+            cy = origin.y() + int(self.marked_point[1] * scale_factor)
+            rect = rect.united(QRect(cx - 12, cy - 12, 25, 25))
+        return rect
 
-            for point in self.current_detection:
-                # Draw scaled point with quality-based color
-                scaled_point = point * scale_factor
-                if hasattr(self, "current_quality") and self.current_quality:
-                    color = self._get_quality_color(
-                        self.current_quality.get("score", 0)
-                    )
-                else:
-                    color = QColor(0, 255, 0)  # Default to green
-
-                painter.setPen(QPen(color, 2))
-                painter.drawEllipse(
-                    int(scaled_point[0] - 3), int(scaled_point[1] - 3), 6, 6
-                )
-        finally:
-            painter.end()
+    def _frame_rect(self):
+        """Where the label draws the scaled frame, in label coordinates"""
+        return self.display_label.image_rect()
 
     def _get_quality_color(self, quality_score: float) -> QColor:
         """Get color based on quality score"""
-        if quality_score >= 0.8:
-            return QColor(0, 255, 0)  # Good - Green
-        elif quality_score >= 0.6:
-            return QColor(255, 255, 0)  # Warning - Yellow
-        else:
-            return QColor(255, 0, 0)  # Poor - Red
+        return _QUALITY_COLORS[(quality_score >= 0.6) + (quality_score >= 0.8)]
 
     def _calculate_scale_factor(self):
-        """Calculate scale factor between original image and display size"""
-        if not hasattr(self, "current_frame") or self.current_frame is None:
-            return 1.0
-
-        # Get original image dimensions
-        img_height, img_width = self.current_frame.shape[:2]
-
-        # Get display dimensions
-        display_width = self.display_label.width()
-        display_height = self.display_label.height()
-
-        # Calculate scale factors
-        width_scale = display_width / img_width
-        height_scale = display_height / img_height
-
-        # Use the smaller scale to maintain aspect ratio
-        return min(width_scale, height_scale)
+        """Scale factor between original image and display size"""
+        return self._scale_factor
 
     def mousePressEvent(self, event):
         """Handle mouse click for point selection"""
-        if not hasattr(self, "preview_active") or not self.preview_active:
+        if not self.preview_active:
             return
 
         # Get measurement viewmodel to check if measuring is active
-        locator = ServiceLocator.get_instance()
-        measurement_vm = locator.get_service("measurement_viewmodel")
-        if not measurement_vm.measuring_active:
+        if self._measurement_vm is None:
+            self._measurement_vm = ServiceLocator.get_instance().get_service(
+                "measurement_viewmodel"
+            )
+        if not self._measurement_vm.measuring_active:
             return
 
         # Convert click coordinates to image coordinates
         pos = event.pos()
         label_pos = self.display_label.mapFrom(self, pos)
 
-        if self.current_pixmap:
+        if self.display_label.image is not None:
             # Convert coordinates from display scale to original image scale
             scale_factor = self._calculate_scale_factor()
             if scale_factor > 0:
-                x = float(label_pos.x()) / scale_factor
-                y = float(label_pos.y()) / scale_factor
+                origin = self._frame_rect().topLeft()
+                x = float(label_pos.x() - origin.x()) / scale_factor
+                y = float(label_pos.y() - origin.y()) / scale_factor
 
                 # Emit signal for point selection
                 self.view_model.point_selected.emit(x, y)
@@ -285,23 +436,8 @@ class CameraView(QWidget):
                 self.mark_point(x, y)
 
     def mark_point(self, x: float, y: float):
-        """Draw a temporary marker at the selected point"""
-        if self.current_pixmap is not None:
-            working_pixmap = self.current_pixmap.copy()
-            painter = QPainter(working_pixmap)
-
-            # Draw a crosshair or circle at the point
-            painter.setPen(QPen(QColor(255, 0, 0), 2))  # Red pen
-            size = 10
-            painter.drawLine(int(x - size), int(y), int(x + size), int(y))
-            painter.drawLine(int(x), int(y - size), int(x), int(y + size))
-
-            painter.end()
-
-            # Scale and display
-            scaled_pixmap = working_pixmap.scaled(
-                self.display_label.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            self.display_label.setPixmap(scaled_pixmap)
+        """Show a marker at the selected point until the next frame"""
+        old_rect = self._overlay_rect()
+        self.marked_point = (x, y)
+        self._overlay_dirty = True
+        self.display_label.update(old_rect.united(self._overlay_rect()))
@@ -8,6 +8,7 @@ class CalibrationSettings(Enum):
     MIN_COVERAGE = "min_coverage"
     PATTERN_ROWS = "pattern_rows"
     PATTERN_COLS = "pattern_cols"
+    SOLVER_USE_LU = "solver_use_lu"
 
     @classmethod
     def get_default(cls) -> dict:
@@ -18,35 +19,6 @@ class CalibrationSettings(Enum):
             cls.MIN_COVERAGE.value: 0.25,
             cls.PATTERN_ROWS.value: 6,
             cls.PATTERN_COLS.value: 9,
+            cls.SOLVER_USE_LU.value: True,
         }
 
-
-class CalibrationTarget(Enum):
-    CUBE = "cube"
-    CHECKERBOARD = "checkerboard"
-
-    @classmethod
-    def list(cls) -> list:
-        return [member.value for member in cls]
-
-    @classmethod
-    def is_valid(cls, value: str) -> bool:
-        return value in cls.list()
-
-
-class CameraSetup(Enum):
-    STEREO_3 = "stereo_3"
-    STEREO_2 = "stereo_2"
-    STEREO_4 = "stereo_4"
-
-    @classmethod
-    def list(cls) -> list:
-        return [member.value for member in cls]
-
-    @classmethod
-    def is_valid(cls, value: str) -> bool:
-        return value in cls.list()
-
-    @classmethod
-    def get_num_cameras(cls, setup: str) -> int:
-        return 3 if setup == cls.STEREO_3.value else 2
@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import lru_cache
 
 
 class CalibrationTarget(Enum):
@@ -6,12 +7,17 @@ class CalibrationTarget(Enum):
     CHECKERBOARD = "checkerboard"
 
     @classmethod
-    def list(cls) -> list:
-        return [member.value for member in cls]
+    @lru_cache(maxsize=None)
+    def list(cls) -> tuple:
+        return tuple(member.value for member in cls)
 
     @classmethod
     def is_valid(cls, value: str) -> bool:
-        return value in cls.list()
+        return value in _CALIBRATION_TARGET_VALUES
+
+
+# Built once so is_valid is a hashed lookup
+_CALIBRATION_TARGET_VALUES = frozenset(member.value for member in CalibrationTarget)
 
 
 class CameraSetup(Enum):
@@ -19,14 +25,16 @@ class CameraSetup(Enum):
     STEREO_2 = "stereo_2"
 
     @classmethod
-    def list(cls) -> list:
-        return [member.value for member in cls]
+    @lru_cache(maxsize=None)
+    def list(cls) -> tuple:
+        return tuple(member.value for member in cls)
 
     @classmethod
     def is_valid(cls, value: str) -> bool:
-        return value in cls.list()
+        return value in _CAMERA_SETUP_VALUES
 
     @classmethod
+    @lru_cache(maxsize=None)
     def get_num_cameras(cls, setup: str) -> int:
         if setup == cls.STEREO_3.value:
             return 3
@@ -34,3 +42,6 @@ class CameraSetup(Enum):
             return 2
         else:
             return 3  # Default to stereo_3 if invalid setup
+
+
+_CAMERA_SETUP_VALUES = frozenset(member.value for member in CameraSetup)
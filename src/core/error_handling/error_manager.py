@@ -1,10 +1,15 @@
 # src/core/error_handling/error_manager.py
 
 from PySide6.QtCore import QObject, Signal
+import logging
 import traceback
-from typing import Optional, List
+from collections import defaultdict
+from functools import cached_property
+from typing import Optional, List, Dict
 from .exceptions import ErrorSeverity, ErrorCategory, ValidationSystemError
 
+logger = logging.getLogger(__name__)
+
 class SystemError:
     """Represents a system error with full context"""
     def __init__(self, 
@@ -18,8 +23,18 @@ class SystemError:
         self.message = message
         self.exception = exception
         self.recovery_hint = recovery_hint
-        self.stack_trace = traceback.format_exc() if exception else None
         
+    @cached_property
+    def stack_trace(self) -> Optional[str]:
+        """Formatted traceback of the exception, built the first time it is read"""
+        if self.exception is None:
+            return None
+        return "".join(
+            traceback.format_exception(
+                type(self.exception), self.exception, self.exception.__traceback__
+            )
+        )
+
     def __str__(self):
         return f"[{self.severity.value}][{self.category.value}] {self.message}"
 
@@ -31,12 +46,18 @@ class ErrorManager(QObject):
     
     def __init__(self):
         super().__init__()
-        self.active_errors: List[SystemError] = []
+        # Insertion-ordered sets (dict keys): O(1) membership and removal, with
+        # each active error also filed under its severity
+        self.active_errors: Dict[SystemError, None] = {}
+        self._active_by_severity: Dict[ErrorSeverity, Dict[SystemError, None]] = (
+            defaultdict(dict)
+        )
         self.error_history: List[SystemError] = []
         
     def report_error(self, error: SystemError):
         """Report a new system error"""
-        self.active_errors.append(error)
+        self.active_errors[error] = None
+        self._active_by_severity[error.severity][error] = None
         self.error_history.append(error)
         self.error_occurred.emit(error)
         
@@ -46,7 +67,8 @@ class ErrorManager(QObject):
     def resolve_error(self, error: SystemError):
         """Mark an error as resolved"""
         if error in self.active_errors:
-            self.active_errors.remove(error)
+            del self.active_errors[error]
+            del self._active_by_severity[error.severity][error]
             self.error_resolved.emit(error)
     
     def handle_critical_error(self, error: SystemError):
@@ -63,20 +85,17 @@ class ErrorManager(QObject):
             'stack_trace': error.stack_trace,
             'recovery_hint': error.recovery_hint
         }
-        # TODO: Implement logging once logging system is in place
+        logger.critical("Critical error: %s", error_details)
         
     def get_active_errors(self, 
                          severity: Optional[ErrorSeverity] = None,
                          category: Optional[ErrorCategory] = None) -> List[SystemError]:
         """Get filtered list of active errors"""
-        errors = self.active_errors
-        if severity:
-            errors = [e for e in errors if e.severity == severity]
+        errors = self._active_by_severity[severity] if severity else self.active_errors
         if category:
-            errors = [e for e in errors if e.category == category]
-        return errors
+            return [e for e in errors if e.category == category]
+        return list(errors)
     
     def has_critical_errors(self) -> bool:
         """Check if there are any active critical errors"""
-        return any(e.severity == ErrorSeverity.CRITICAL 
-                  for e in self.active_errors)
\ No newline at end of file
+        return bool(self._active_by_severity[ErrorSeverity.CRITICAL])
\ No newline at end of file
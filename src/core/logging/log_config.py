@@ -0,0 +1,27 @@
+# src/core/logging/log_config.py
+
+import logging
+import logging.handlers
+import queue
+
+
+def setup_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """
+    Route all log records through a queue so callers (the GUI thread in
+    particular) only enqueue; a background listener does the console I/O.
+    Returns the started listener, which should be stopped on shutdown.
+    """
+    log_queue = queue.SimpleQueue()
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(
+        logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    )
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, console_handler)
+    listener.start()
+    return listener
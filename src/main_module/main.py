@@ -4,6 +4,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from PySide6.QtWidgets import QApplication
+from core.logging.log_config import setup_logging
 from main_module.views.main_window import MainWindow
 from services.service_locator import ServiceLocator
 from services.settings_service import SettingsService
@@ -62,6 +63,7 @@ def initialize(locator):
 
 
 if __name__ == "__main__":
+    log_listener = setup_logging()
     app = QApplication([])
     locator = ServiceLocator.get_instance()
     locator.register_service("navigation_service", NavigationService())
@@ -69,3 +71,8 @@ if __name__ == "__main__":
     initialize(locator)
     window.show()
     app.exec()
+    locator.get_service("camera_server").close_all()
+    for camera_model in locator.get_services("camera_model_"):
+        camera_model.stop()  # Joins its frame watcher; the camera is closed already
+    locator.get_service("settings_service").wait_for_saves()
+    log_listener.stop()
@@ -1,9 +1,13 @@
 # In measurement_module/viewmodels/measurement_viewmodel.py
+from functools import partial
 from PySide6.QtCore import QObject, Signal
 import numpy as np
 import cv2
 from services.service_locator import ServiceLocator
-from core.constants.calibration_constants import CameraSetup
+from core.constants.settings_constants import CameraSetup
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class MeasurementViewModel(QObject):
@@ -15,16 +19,14 @@ class MeasurementViewModel(QObject):
         self.locator = ServiceLocator.get_instance()
         self.calibration_storage = self.locator.get_service("calibration_storage")
         self.settings_service = self.locator.get_service("settings_service")
-        self.camera_viewmodels = []
 
         # Get camera viewmodels
         num_cameras = self.get_camera_count()
-        for i in range(num_cameras):
-            vm = self.locator.get_service(f"camera_viewmodel_{i}")
-            self.camera_viewmodels.append(vm)
-            vm.point_selected.connect(
-                lambda x, y, cam_idx=i: self.handle_point_selection(cam_idx, x, y)
-            )
+        self.camera_viewmodels = self.locator.get_services("camera_viewmodel_")[
+            :num_cameras
+        ]
+        for i, vm in enumerate(self.camera_viewmodels):
+            vm.point_selected.connect(partial(self.handle_point_selection, i))
 
         self.preview_active = False
         self.measuring_active = False
@@ -60,7 +62,7 @@ class MeasurementViewModel(QObject):
         if not self.measuring_active:
             return
 
-        print(f"Point selected: Camera {camera_idx}, x={x}, y={y}")  # Debug print
+        logger.debug("Point selected: camera %d, x=%.1f, y=%.1f", camera_idx, x, y)
 
         # Check if this camera has already been used for current point
         current_points = (
@@ -139,7 +141,7 @@ class MeasurementViewModel(QObject):
             self.status_changed.emit("Select point 1 in first camera view")
 
         except Exception as e:
-            print(f"Error computing 3D distance: {str(e)}")
+            logger.exception("Error computing 3D distance")
             self.status_changed.emit(f"Measurement failed: {str(e)}")
 
     def get_camera_count(self):
@@ -1,4 +1,4 @@
-from PySide6.QtCore import QObject, Signal, Property
+from PySide6.QtCore import QObject, QTimer, Signal, Property
 from core.constants.settings_constants import CalibrationTarget, CameraSetup
 from services.service_locator import ServiceLocator
 from services.navigation_service import ViewType
@@ -9,18 +9,23 @@ class SettingsViewModel(QObject):
 
     def __init__(self):
         super().__init__()
-        self._settings_service = ServiceLocator.get_instance().get_service(
-            "settings_service"
-        )
-        self._navigation_service = ServiceLocator.get_instance().get_service(
-            "navigation_service"
-        )
+        locator = ServiceLocator.get_instance()
+        self._settings_service = locator.get_service("settings_service")
+        self._navigation_service = locator.get_service("navigation_service")
+
+        # A burst of setting changes (e.g. a held spin box arrow) notifies the
+        # view once, after control returns to the event loop
+        self._notify_timer = QTimer(self)
+        self._notify_timer.setSingleShot(True)
+        self._notify_timer.setInterval(0)
+        self._notify_timer.timeout.connect(self.settings_changed)
 
         # Connect to service changes
         self._settings_service.setting_changed.connect(self._on_setting_changed)
 
     def _on_setting_changed(self, key: str, value: str):
-        self.settings_changed.emit()
+        if not self._notify_timer.isActive():
+            self._notify_timer.start()
 
     def update_setting(self, key: str, value: str):
         """Update setting value using the nested structure"""
@@ -48,15 +53,12 @@ class SettingsViewModel(QObject):
         if CalibrationTarget.is_valid(value):
             self._settings_service.update_setting("target_type", value)
 
-    def get_camera_setups(self) -> list:
+    def get_camera_setups(self) -> tuple:
         return CameraSetup.list()
 
-    def get_target_types(self) -> list:
+    def get_target_types(self) -> tuple:
         return CalibrationTarget.list()
 
-    def get_setting(self, key: str) -> str:
-        return self._settings_service.get_setting(key)
-
     # Add property setters/getters for each new setting
     @Property(int, notify=settings_changed)
     def pattern_rows(self) -> int:
@@ -70,7 +72,7 @@ class SettingsViewModel(QObject):
     def pattern_cols(self) -> int:
         return int(self._settings_service.get_setting("pattern_cols"))
 
-    @pattern_rows.setter
+    @pattern_cols.setter
     def pattern_cols(self, value: int):
         self._settings_service.update_setting("pattern_cols", str(value))
 
@@ -1,3 +1,4 @@
+from functools import partial
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton
 from PySide6.QtCore import Qt
 from services.service_locator import ServiceLocator
@@ -32,16 +33,11 @@ class MainView(QWidget):
         self.setLayout(layout)
 
     def connect_signals(self):
-        self.calibrate_btn.clicked.connect(
-            lambda: self.view_model.navigate_to(ViewType.CALIBRATION)
-        )
-        self.settings_btn.clicked.connect(
-            lambda: self.view_model.navigate_to(ViewType.SETTINGS)
-        )
-        self.measure_btn.clicked.connect(
-            lambda: self.view_model.navigate_to(ViewType.MEASUREMENT)
-        )
+        navigate_to = self.view_model.navigate_to
+        self.calibrate_btn.clicked.connect(partial(navigate_to, ViewType.CALIBRATION))
+        self.settings_btn.clicked.connect(partial(navigate_to, ViewType.SETTINGS))
+        self.measure_btn.clicked.connect(partial(navigate_to, ViewType.MEASUREMENT))
 
     def change_view_block(self, is_active: bool):
-        for element in self.findChildren(QWidget):
-            element.setEnabled(not is_active)
+        # Qt disables every descendant along with their parent
+        self.setEnabled(not is_active)
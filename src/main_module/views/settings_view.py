@@ -1,3 +1,4 @@
+from functools import partial
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -77,32 +78,35 @@ class SettingsView(QWidget):
 
     def connect_signals(self):
         # Connect UI to ViewModel
+        # Bind the key with partial so each slot is a bound method, not a lambda
+        update_setting = self.viewmodel.update_setting
         self.camera_setup_combo.currentTextChanged.connect(
-            lambda v: self.viewmodel.update_setting("cameras.camera_setup", v)
+            partial(update_setting, "cameras.camera_setup")
         )
         self.target_type_combo.currentTextChanged.connect(
-            lambda v: self.viewmodel.update_setting("calibration.target_type", v)
+            partial(update_setting, "calibration.target_type")
         )
         # Add new signals
         self.pattern_rows_spin.valueChanged.connect(
-            lambda v: self.viewmodel.update_setting("calibration.pattern_rows", v)
+            partial(update_setting, "calibration.pattern_rows")
         )
         self.pattern_cols_spin.valueChanged.connect(
-            lambda v: self.viewmodel.update_setting("calibration.pattern_cols", v)
+            partial(update_setting, "calibration.pattern_cols")
         )
         self.quality_score_spin.valueChanged.connect(
-            lambda v: self.viewmodel.update_setting(
-                "calibration.min_quality_score", str(v)
-            )
+            partial(self._update_text_setting, "calibration.min_quality_score")
         )
         self.coverage_spin.valueChanged.connect(
-            lambda v: self.viewmodel.update_setting("calibration.min_coverage", str(v))
+            partial(self._update_text_setting, "calibration.min_coverage")
         )
 
         self.back_btn.clicked.connect(self.viewmodel.navigate_back)
         # Update UI when settings change
         self.viewmodel.settings_changed.connect(self.update_ui)
 
+    def _update_text_setting(self, key: str, value: float):
+        self.viewmodel.update_setting(key, str(value))
+
     def update_ui(self):
         self.camera_setup_combo.setCurrentText(self.viewmodel.camera_setup)
         self.target_type_combo.setCurrentText(self.viewmodel.target_type)
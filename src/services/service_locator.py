@@ -21,5 +21,19 @@ class ServiceLocator:
     def get_service(self, name: str) -> object:
         if name not in self._services:
             raise Exception(f"Service {name} not found")
-        return self._services[name] 
-       
\ No newline at end of file
+        return self._services[name]
+
+    def register_services(self, services: dict):
+        """Register several services at once"""
+        duplicates = self._services.keys() & services.keys()
+        if duplicates:
+            raise Exception(f"Services {sorted(duplicates)} already registered")
+        self._services.update(services)
+
+    def get_services(self, prefix: str) -> list:
+        """All services whose name starts with prefix, in registration order"""
+        return [
+            service
+            for name, service in self._services.items()
+            if name.startswith(prefix)
+        ]
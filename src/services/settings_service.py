@@ -1,7 +1,31 @@
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
 import json
+import logging
+import os
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+
+class SettingsWriter(QRunnable):
+    """Writes a serialized settings snapshot to disk off the GUI thread."""
+
+    def __init__(self, settings_file: Path, payload: str):
+        super().__init__()
+        self._settings_file = settings_file
+        self._payload = payload
+
+    def run(self):
+        # Write to a temp file and swap it in, so a crash mid-write never
+        # leaves a truncated settings.json behind
+        tmp_file = self._settings_file.with_suffix(".json.tmp")
+        try:
+            with open(tmp_file, "w") as f:
+                f.write(self._payload)
+            os.replace(tmp_file, self._settings_file)
+        except Exception:
+            logger.exception("Error saving settings")
+
 
 class SettingsService(QObject):
     setting_changed = Signal(str, str)  # key, value
@@ -21,12 +45,17 @@ class SettingsService(QObject):
                 "min_coverage": 0.25,
                 "pattern_rows": 6,
                 "pattern_cols": 9,
+                "solver_use_lu": True,
             },
             "cameras": {"camera_setup": "stereo_2"},
         }
         self._settings = self._default_settings.copy()
         self.load_settings()
 
+        # Single writer thread keeps saves in order
+        self._save_pool = QThreadPool()
+        self._save_pool.setMaxThreadCount(1)
+
     # In settings_service.py
     def get_setting(self, key: str) -> str:
         if "." in key:
@@ -44,6 +73,10 @@ class SettingsService(QObject):
         # Finally try in root (though we shouldn't have any here)
         return self._settings.get(key)
 
+    def get_settings(self, section: str) -> dict:
+        """Return a whole settings section (e.g. "calibration") in one lookup."""
+        return self._settings.get(section, {})
+
     def update_setting(self, key: str, value: str):
         if "." in key:
             section, setting = key.split(".")
@@ -60,12 +93,18 @@ class SettingsService(QObject):
             if self._settings_file.exists():
                 with open(self._settings_file, "r") as f:
                     self._settings.update(json.load(f))
-        except Exception as e:
-            print(f"Error loading settings: {e}")
+        except Exception:
+            logger.exception("Error loading settings")
 
     def save_settings(self):
+        """Snapshot the settings and write them to disk in the background."""
         try:
-            with open(self._settings_file, "w") as f:
-                json.dump(self._settings, f, indent=4)
-        except Exception as e:
-            print(f"Error saving settings: {e}")
+            payload = json.dumps(self._settings, indent=4)
+        except Exception:
+            logger.exception("Error saving settings")
+            return
+        self._save_pool.start(SettingsWriter(self._settings_file, payload))
+
+    def wait_for_saves(self):
+        """Block until all queued settings writes have finished."""
+        self._save_pool.waitForDone()
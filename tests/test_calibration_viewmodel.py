@@ -0,0 +1,129 @@
+import os
+import sys
+import time
+import unittest
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import numpy as np
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtWidgets import QApplication
+
+from services.service_locator import ServiceLocator
+from services.settings_service import SettingsService
+from core.error_handling.error_manager import ErrorManager
+from calibration_module.viewmodels.calibration_viewmodel import CalibrationViewModel
+
+
+class FakeCalibrationModel:
+    """Records each global solve and answers with queued results."""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.initial_params = []
+        self.views = 0
+        self.camera_matrices = self.dist_coeffs = []
+        self.rotations = self.translations = []
+
+    def reset(self):
+        self.views = 0
+
+    def process_view(self, view_idx, frame_data):
+        self.views += 1
+        return True
+
+    def perform_global_calibration(self, initial_params=None):
+        self.initial_params.append(initial_params)
+        return self.results.pop(0)
+
+
+class FakeCalibrationStorage:
+    def store_calibration(self, **calibration):
+        pass
+
+
+class CalibrationViewModelWarmStartTest(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication([])
+        ServiceLocator._instance = None
+        self.seed = ["camera 0", "camera 1"]
+        self.model = FakeCalibrationModel(
+            [
+                {"success": False, "optimized_cameras": self.seed},
+                {"success": True, "optimized_cameras": ["solved 0", "solved 1"]},
+            ]
+        )
+        locator = ServiceLocator.get_instance()
+        locator.register_services(
+            {
+                "settings_service": SettingsService(),
+                "error_manager": ErrorManager(),
+                "calibration_storage": FakeCalibrationStorage(),
+                "calibration_model": self.model,
+            }
+        )
+        self.vm = CalibrationViewModel()
+        # Detection is not under test: every frame yields a valid view
+        points = np.zeros((54, 1, 2), np.float32)
+        self.vm._detector = object()
+        self.vm._get_detection_validator = lambda: (lambda metrics: True)
+        self.vm._detect_frames = lambda frames, is_valid: (
+            [points, points],
+            [{}, {}],
+            2,
+        )
+        self.finished = []
+        self.vm.calibration_finished.connect(
+            lambda success, message, results: self.finished.append(success)
+        )
+
+    def tearDown(self):
+        ServiceLocator._instance = None
+
+    def _capture(self):
+        frames = [np.zeros((4, 4, 3), np.uint8)] * 2
+        self.assertTrue(self.vm.process_frames(frames))
+
+    def _wait_for_solve(self, count):
+        deadline = time.monotonic() + 10
+        while len(self.finished) < count and time.monotonic() < deadline:
+            QCoreApplication.processEvents()
+            time.sleep(0.01)
+        self.assertEqual(len(self.finished), count)
+
+    def test_resolve_after_failure_is_warm_started(self):
+        self.vm.begin_calibration_session()
+        for _ in range(self.vm.required_views):
+            self._capture()
+        self._wait_for_solve(1)
+
+        self.assertEqual(self.finished, [False])
+        self.assertTrue(self.vm.is_calibrating)
+
+        # One more view re-solves, seeded from the failed attempt
+        self._capture()
+        self._wait_for_solve(2)
+
+        self.assertEqual(self.model.initial_params, [None, self.seed])
+        self.assertEqual(self.finished, [False, True])
+        self.assertFalse(self.vm.is_calibrating)
+        self.assertIsNone(self.vm._last_cam_params)
+
+    def test_new_session_is_not_warm_started(self):
+        self.vm.begin_calibration_session()
+        for _ in range(self.vm.required_views):
+            self._capture()
+        self._wait_for_solve(1)
+
+        self.vm.begin_calibration_session()
+        for _ in range(self.vm.required_views):
+            self._capture()
+        self._wait_for_solve(2)
+
+        self.assertEqual(self.model.initial_params, [None, None])
+
+
+if __name__ == "__main__":
+    unittest.main()
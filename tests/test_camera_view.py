@@ -0,0 +1,73 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import numpy as np
+from PySide6.QtCore import QObject, QRect, Signal
+from PySide6.QtWidgets import QApplication
+
+from camera_module.views.camera_view import CameraView
+
+
+class FakeCameraViewModel(QObject):
+    frame_updated = Signal(object)
+    error_occurred = Signal(str)
+    is_frozen = False
+
+
+class CameraViewErrorTest(unittest.TestCase):
+    def setUp(self):
+        self.app = QApplication.instance() or QApplication([])
+        self.view = CameraView(FakeCameraViewModel())
+        self.view.resize(400, 300)
+        self.view.show()
+        self.app.processEvents()
+        self.view.preview_active = True
+        self.view.handle_frame(np.zeros((100, 100, 3), np.uint8))
+
+    def tearDown(self):
+        self.view.hide()
+        self.view.deleteLater()
+
+    def _show_error(self, message):
+        self.view.handle_error(message)
+        # Errors are coalesced on a timer; show this one now
+        self.view._show_pending_error()
+
+    def test_overlay_update_after_error(self):
+        self._show_error("camera lost")
+        points = np.array([[10.0, 10.0], [90.0, 90.0]], np.float32)
+
+        self.view.update_overlay(points, {"score": 0.9})
+        self.view.display_label.grab()
+
+        self.assertEqual(self.view._frame_rect(), QRect())
+        self.assertEqual(self.view._overlay_rect(), QRect())
+        self.assertEqual(self.view.display_label.text(), "Error: camera lost")
+
+    def test_error_drops_the_shown_frame(self):
+        self.view.update_overlay(np.array([[50.0, 50.0]], np.float32))
+        self._show_error("camera lost")
+
+        self.assertIsNone(self.view.current_frame)
+        self.assertIsNone(self.view.current_detection)
+
+        # A resize must not paint the old frame back over the error text
+        self.view.resize(600, 400)
+        self.app.processEvents()
+        self.view._redraw_current_frame()
+        self.assertIsNone(self.view.display_label.image)
+        self.assertEqual(self.view.display_label.text(), "Error: camera lost")
+
+        # The next frame replaces the error
+        self.view.handle_frame(np.zeros((100, 100, 3), np.uint8))
+        self.assertIsNotNone(self.view.display_label.image)
+        self.assertEqual(self.view.display_label.text(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()